@@ -4,8 +4,11 @@ This module builds context for agents running via the Claude Agent SDK harness.
 Note: Pilot (top-level) uses CLAUDE.md natively via Claude Code.
 """
 
+import copy
 import json
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -93,17 +96,64 @@ def load_agent_prompt(agent_name: str) -> str:
     return data.get("prompt", "")
 
 
+# Bytes read from the top of an agent file when looking for its description
+AGENT_HEADER_BYTES = 512
+
+# A plain single-line `description:` value; block scalars (| >), quoted,
+# flow and anchored values fall back to a full YAML parse
+_PLAIN_DESCRIPTION_RE = re.compile(
+    r"^description:[ \t]+([^\s|>'\"\[{&*!%@`#][^\n]*?)[ \t]*$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_agent_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse an agent YAML file; cached per (path, mtime, size) signature."""
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
+
+
 def load_agent_config(agent_name: str) -> dict:
     """Load full agent configuration from YAML.
 
     Returns the complete agent definition including model, tools, etc.
+    Parsed files are cached until they change on disk; each call returns
+    its own copy, so callers may modify the result freely.
     """
     agent_path = Path("agents") / f"{agent_name}.yaml"
-    if not agent_path.exists():
+    try:
+        st = agent_path.stat()
+    except OSError:
         return {}
 
-    with open(agent_path) as f:
-        return yaml.safe_load(f) or {}
+    return copy.deepcopy(_parse_agent_file(str(agent_path), st.st_mtime_ns, st.st_size))
+
+
+def load_agent_description(agent_name: str) -> str:
+    """Load just the description of an agent.
+
+    Reads only the head of the agent file when the description is a plain
+    single-line value near the top (the common layout); otherwise falls
+    back to a full load_agent_config().
+    """
+    agent_path = Path("agents") / f"{agent_name}.yaml"
+    try:
+        with open(agent_path, "rb") as f:
+            head = f.read(AGENT_HEADER_BYTES)
+    except OSError:
+        return ""
+
+    # Only trust lines that ended inside the buffer
+    complete = head[: head.rfind(b"\n") + 1].decode("utf-8", errors="replace")
+    match = _PLAIN_DESCRIPTION_RE.search(complete)
+    if match:
+        value = match.group(1)
+        # The next line must start a new key, not continue a folded scalar
+        following = complete[match.end() + 1:match.end() + 2]
+        if following and not following.isspace() and ": " not in value and " #" not in value:
+            return value
+
+    return str(load_agent_config(agent_name).get("description", ""))
 
 
 def load_project_context(project_id: str) -> str:
@@ -262,6 +262,15 @@ def index_all() -> dict:
         json.dump(output, f, indent=2, default=str)
 
     print(f'Indexed {len(index)} items to data/index.json')
+
+    # Prebuild the DuckDB snapshot so the next search skips the JSON parse
+    # (imported here: repo_search imports this module)
+    from .repo_search import build_index_snapshot
+    try:
+        build_index_snapshot()
+    except Exception as e:
+        print(f'Failed to build index snapshot: {e}')
+
     return output
 
 
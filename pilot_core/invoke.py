@@ -24,15 +24,22 @@ Each invocation is a separate Claude API call, providing:
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
 import random
 import re
 import sys
+import tempfile
+import threading
+import weakref
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import NoReturn, Optional
 
 from claude_code_sdk import (
     query,
@@ -43,12 +50,38 @@ from claude_code_sdk import (
     ToolResultBlock,
 )
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize to JSON bytes with sorted keys (orjson fast path)."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    def _json_dumps_indented(obj) -> str:
+        """Serialize to 2-space indented JSON (orjson fast path).
+
+        Raises TypeError for values that aren't JSON-native.
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        """Serialize to JSON bytes with sorted keys (stdlib fallback)."""
+        return json.dumps(obj, sort_keys=True).encode()
+
+    def _json_dumps_indented(obj) -> str:
+        """Serialize to 2-space indented JSON (stdlib fallback).
+
+        Raises TypeError for values that aren't JSON-native.
+        """
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
 # Retry configuration for rate limits
-# Start at 5 seconds, exponential backoff: 5s, 10s, 20s, 40s, 80s, 160s, 320s (capped)
+# Decorrelated jitter: each wait is drawn from [5s, 3 * previous wait], capped at 320s
 INITIAL_BACKOFF_SECONDS = 5.0
 MAX_BACKOFF_SECONDS = 320.0
-JITTER_FACTOR = 0.25  # +/- 25% jitter
 MAX_RETRY_ATTEMPTS = 10  # For logging purposes, but rate limits retry forever
+# Minimum gap between rate-limited retries across concurrent invocations
+RETRY_SPACING_SECONDS = 1.0
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -56,6 +89,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from pilot_core.context import (
     build_context,
     load_agent_config,
+    load_agent_description,
     get_current_branch,
 )
 from pilot_core.progress import (
@@ -97,6 +131,12 @@ DANGEROUS_PATTERNS = [
     r'wget\s+.*\|\s*sh',       # wget pipe to shell
     r'curl\s+.*\|\s*bash',     # curl pipe to bash
 ]
+_DANGEROUS_REGEXES = [re.compile(p, re.IGNORECASE) for p in DANGEROUS_PATTERNS]
+# Single alternation used to rule out all patterns in one scan; the common
+# (safe) case never touches the per-pattern regexes above.
+_ANY_DANGEROUS_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in DANGEROUS_PATTERNS), re.IGNORECASE
+)
 
 # Pre-invocation guard: Task keywords that suggest misrouted tasks
 AGENT_ROUTING_HINTS = {
@@ -113,11 +153,6 @@ AGENT_ROUTING_HINTS = {
 }
 
 
-def _has_file_changes(tool_uses: list) -> bool:
-    """Check if any tool uses indicate file modifications."""
-    return any(t.get('tool') in FILE_MODIFYING_TOOLS for t in tool_uses)
-
-
 class PreTaskHookError(Exception):
     """Raised when a pre_task hook fails, aborting agent execution."""
     pass
@@ -143,8 +178,6 @@ def _process_pre_task_hooks(config: dict, task: str) -> None:
     if not pre_task_hooks:
         return
 
-    logger = logging.getLogger('pilot.invoke')
-
     for action in pre_task_hooks:
         if action == 'validate_config':
             # Check config has required fields
@@ -175,7 +208,7 @@ def _process_pre_task_hooks(config: dict, task: str) -> None:
 
 async def _process_post_task_hooks(
     config: dict,
-    tool_uses: list,
+    file_changes: bool,
     task: str,
     success: bool,
     run_id: Optional[str] = None,
@@ -185,6 +218,14 @@ async def _process_post_task_hooks(
     Process post_task hooks defined in agent config.
 
     Fire-and-forget: errors are logged but don't fail the main result.
+
+    Args:
+        config: Agent configuration dict
+        file_changes: Whether the agent used any FILE_MODIFYING_TOOLS
+        task: The task description that was executed
+        success: Whether the invocation succeeded
+        run_id: Optional run ID to link hook invocations
+        verbose: Print hook agent output as it streams
     """
     if not success:
         return
@@ -195,13 +236,11 @@ async def _process_post_task_hooks(
     if not post_task_hooks:
         return
 
-    logger = logging.getLogger('pilot.invoke')
-
     for action in post_task_hooks:
         # hooks.post_task is a list of action strings (e.g., ['run_verifier'])
         if action == 'run_verifier':
             # Only run verifier if file changes were made
-            if not _has_file_changes(tool_uses):
+            if not file_changes:
                 logger.debug('Skipping verifier hook: no file changes detected')
                 continue
 
@@ -217,6 +256,40 @@ async def _process_post_task_hooks(
             logger.warning(f'Unknown post_task hook action: {action}')
 
 
+# Strong references to running post_task hook tasks (the event loop itself
+# only keeps weak references, so unreferenced tasks could be collected)
+_pending_hook_tasks: set[asyncio.Task] = set()
+
+
+def _schedule_post_task_hooks(**kwargs) -> Optional[asyncio.Task]:
+    """Run _process_post_task_hooks in the background without awaiting it.
+
+    Returns:
+        The scheduled task, or None if there is nothing to run
+    """
+    if not kwargs.get('success') or not kwargs['config'].get('hooks', {}).get('post_task'):
+        return None
+
+    task = asyncio.create_task(_process_post_task_hooks(**kwargs))
+    _pending_hook_tasks.add(task)
+    task.add_done_callback(_pending_hook_tasks.discard)
+    return task
+
+
+async def wait_for_post_task_hooks() -> None:
+    """Wait until all post_task hooks scheduled on this event loop finish.
+
+    Hooks may schedule further hooks (e.g. a verifier run), so this loops
+    until none remain. Hook failures are already logged, not raised.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        pending = [t for t in _pending_hook_tasks if t.get_loop() is loop]
+        if not pending:
+            return
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 def check_task_legitimacy(task: str, agent_name: str) -> dict:
     """Pre-invocation guard to block dangerous commands and warn about misrouted tasks.
 
@@ -234,16 +307,18 @@ def check_task_legitimacy(task: str, agent_name: str) -> dict:
 
         Empty dict if no issues found.
     """
-    task_lower = task.lower()
-
     # Check for dangerous patterns - these BLOCK invocation
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, task, re.IGNORECASE):
-            return {
-                'error': True,
-                'message': f"Task contains dangerous pattern: '{pattern}'. Invocation blocked for safety.",
-                'pattern': pattern,
-            }
+    if _ANY_DANGEROUS_RE.search(task):
+        for regex in _DANGEROUS_REGEXES:
+            if regex.search(task):
+                pattern = regex.pattern
+                return {
+                    'error': True,
+                    'message': f"Task contains dangerous pattern: '{pattern}'. Invocation blocked for safety.",
+                    'pattern': pattern,
+                }
+
+    task_lower = task.lower()
 
     # Check for misrouted tasks - these generate warnings but don't block
     for keyword, suggested_agent in AGENT_ROUTING_HINTS.items():
@@ -302,18 +377,47 @@ def extract_retry_after(error: Exception) -> Optional[float]:
     return None
 
 
-def calculate_backoff(attempt: int, retry_after: Optional[float] = None) -> float:
-    """Calculate backoff time with exponential increase and jitter."""
+# One gate per event loop (invoke_sync creates a fresh loop per call)
+_rate_limit_gates: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_rate_limit_gate() -> asyncio.Semaphore:
+    """Return the process-wide rate-limit retry gate for the running loop."""
+    loop = asyncio.get_running_loop()
+    gate = _rate_limit_gates.get(loop)
+    if gate is None:
+        gate = _rate_limit_gates[loop] = asyncio.Semaphore(1)
+    return gate
+
+
+def calculate_backoff(
+    attempt: int,
+    retry_after: Optional[float] = None,
+    prev_backoff: Optional[float] = None,
+) -> float:
+    """Calculate backoff time using decorrelated jitter.
+
+    Each wait is drawn uniformly from [INITIAL_BACKOFF_SECONDS, 3 * previous
+    wait] and capped at MAX_BACKOFF_SECONDS, so concurrent clients that were
+    rate limited together drift apart instead of retrying in lockstep.
+
+    Args:
+        attempt: 0-indexed retry attempt (used when prev_backoff is unknown)
+        retry_after: Server-provided Retry-After seconds, honoured as-is
+        prev_backoff: The previous wait returned for this retry sequence
+
+    Returns:
+        Seconds to wait before retrying
+    """
     if retry_after is not None:
-        # Respect Retry-After but still add small jitter
-        base = min(retry_after, MAX_BACKOFF_SECONDS)
-    else:
-        # Exponential backoff: 1, 2, 4, 8, 16, 32, 60, 60, ...
-        base = min(INITIAL_BACKOFF_SECONDS * (2 ** attempt), MAX_BACKOFF_SECONDS)
+        return max(0.1, min(retry_after, MAX_BACKOFF_SECONDS))
 
-    # Add jitter to prevent thundering herd
-    jitter = base * JITTER_FACTOR * (2 * random.random() - 1)
-    return max(0.1, base + jitter)
+    if prev_backoff is None:
+        prev_backoff = min(INITIAL_BACKOFF_SECONDS * (2 ** attempt), MAX_BACKOFF_SECONDS)
+
+    return min(MAX_BACKOFF_SECONDS, random.uniform(INITIAL_BACKOFF_SECONDS, prev_backoff * 3))
 
 
 # Model mapping - agents can specify model in their YAML
@@ -324,6 +428,35 @@ MODEL_MAP = {
 }
 
 
+@lru_cache(maxsize=16)
+def _thinking_settings_file(thinking_json: bytes) -> str:
+    """Write thinking settings to a temp file once per unique config.
+
+    The file lives for the whole process and is removed at interpreter exit,
+    so repeated invocations with the same config reuse the same path.
+
+    Args:
+        thinking_json: Settings serialized by _json_dumps (the cache key)
+
+    Returns:
+        Path to the settings file
+    """
+    fd, path = tempfile.mkstemp(suffix='.json', prefix='agent_settings_')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(thinking_json)
+    atexit.register(_unlink_quietly, path)
+    logger.debug(f"Created thinking settings file: {path}")
+    return path
+
+
+def _unlink_quietly(path: str) -> None:
+    """Remove a file, ignoring errors (used for atexit cleanup)."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 def _format_context_for_prompt(ctx: dict) -> str:
     """Format gathered context as a prompt section."""
     if not ctx:
@@ -370,6 +503,10 @@ def _extract_project_from_task(task: str) -> Optional[str]:
     return None
 
 
+# .runs directories already created by this process (absolute paths)
+_RUNS_DIR_CACHE: set[str] = set()
+
+
 def _create_delegation_manifest(
     agent_name: str,
     task: str,
@@ -394,9 +531,12 @@ def _create_delegation_manifest(
     if not project:
         return None
 
-    # Create .runs directory if needed
+    # Create .runs directory if needed (once per process per directory)
     runs_dir = Path("projects") / project / ".runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
+    runs_dir_key = str(runs_dir.absolute())
+    if runs_dir_key not in _RUNS_DIR_CACHE:
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        _RUNS_DIR_CACHE.add(runs_dir_key)
 
     # Generate manifest filename
     timestamp = datetime.now()
@@ -414,8 +554,15 @@ def _create_delegation_manifest(
         "files_modified": [],  # Initially empty, tracked by other mechanisms
     }
 
-    with open(manifest_path, "w") as f:
-        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    try:
+        f = open(manifest_path, "w")
+    except FileNotFoundError:
+        # Directory was removed since we cached it - recreate and retry
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        f = open(manifest_path, "w")
+    with f:
+        yaml.dump(manifest, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
 
     return manifest_path
 
@@ -441,7 +588,6 @@ def _process_context_injection(config: dict, task: str) -> str:
     if not injection_config:
         return ''
 
-    logger = logging.getLogger('pilot.invoke')
     sections = []
 
     # Process 'rules' injection
@@ -545,6 +691,50 @@ def _process_context_injection(config: dict, task: str) -> str:
     return '\n\n<injected-context>\n' + '\n'.join(sections) + '\n</injected-context>\n\n'
 
 
+def _reap_child(pid: int) -> None:
+    """Wait for a detached child to exit so it doesn't linger as a zombie."""
+    try:
+        os.waitpid(pid, 0)
+    except ChildProcessError:
+        pass  # Already reaped elsewhere
+
+
+def _spawn_detached(cmd: list[str]) -> int:
+    """Start cmd in a new session with stdout/stderr sent to /dev/null.
+
+    Uses os.posix_spawnp where available, which avoids fork()'s page-table
+    copy of a large parent heap; falls back to subprocess.Popen elsewhere.
+    A daemon thread waits on the spawned child so it is reaped when it
+    exits instead of lingering as a zombie for the parent's lifetime.
+
+    Args:
+        cmd: Command and arguments (cmd[0] is resolved via PATH)
+
+    Returns:
+        PID of the spawned process
+    """
+    if hasattr(os, 'posix_spawnp'):
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+        pid = os.posix_spawnp(
+            cmd[0], cmd, os.environ,
+            file_actions=file_actions,
+            setsid=True,  # Detach from parent
+        )
+        threading.Thread(target=_reap_child, args=(pid,), daemon=True).start()
+        return pid
+
+    import subprocess
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,  # Detach from parent
+    ).pid
+
+
 async def invoke_agent(
     agent_name: str,
     task: str,
@@ -552,6 +742,7 @@ async def invoke_agent(
     verbose: bool = False,
     background: bool = False,
     project: Optional[str] = None,
+    background_hooks: bool = False,
 ) -> dict:
     """
     Invoke an SDK-based agent.
@@ -563,6 +754,9 @@ async def invoke_agent(
         verbose: Print output as it streams
         background: If True, spawn agent in background subprocess and return immediately
         project: Optional project name for progress tracking (auto-detected if not provided)
+        background_hooks: If True, post_task hooks run as background tasks and
+            this returns without waiting for them; the caller must then await
+            wait_for_post_task_hooks() before its event loop closes
 
     Returns:
         dict with:
@@ -591,7 +785,6 @@ async def invoke_agent(
     # Handle background mode - spawn subprocess and return immediately
     if background:
         import uuid
-        import subprocess
 
         # Generate run_id if not provided
         if run_id is None:
@@ -614,7 +807,7 @@ async def invoke_agent(
             )
             write_progress(bg_project, initial_progress)
 
-        # Spawn subprocess - use Popen for true detachment
+        # Spawn subprocess in its own session for true detachment
         cmd = [
             "uv", "run", "python", "-m", "lib.invoke",
             agent_name, task,
@@ -624,12 +817,7 @@ async def invoke_agent(
             cmd.append("--verbose")
 
         # Start detached process
-        subprocess.Popen(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,  # Detach from parent
-        )
+        _spawn_detached(cmd)
 
         # Return immediately with run_id
         return {
@@ -657,7 +845,7 @@ async def invoke_agent(
             "blocked_pattern": legitimacy_check.get("pattern"),
         }
     if legitimacy_check.get("warning"):
-        logging.getLogger("pilot.invoke").warning(
+        logger.warning(
             f"Possible misrouted task: {legitimacy_check.get('message')}"
         )
 
@@ -691,7 +879,7 @@ async def invoke_agent(
     detected_project = _extract_project_from_task(task)
     context = build_context(agent_name, project_id=detected_project)
     if detected_project:
-        logging.getLogger("pilot.invoke").info(
+        logger.info(
             f"[AUTO] Injected project context for '{detected_project}'"
         )
 
@@ -724,30 +912,15 @@ async def invoke_agent(
 
     # Handle thinking configuration via settings file
     settings_file = None
-    cleanup_settings = False
     if config.get('thinking'):
-        # Create a temporary settings file with thinking configuration
-        import tempfile
-        import json
-
         settings_data = {
             'thinking': {
                 'enabled': config['thinking'].get('type') == 'enabled',
                 'budget_tokens': config['thinking'].get('budget_tokens', 10000)
             }
         }
-
-        # Create temp file that will be cleaned up after agent runs
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.json',
-            delete=False,
-            prefix='agent_settings_'
-        ) as f:
-            json.dump(settings_data, f)
-            settings_file = f.name
-            cleanup_settings = True
-            logger.debug(f"Created thinking settings file: {settings_file}")
+        # Identical thinking configs share one settings file per process
+        settings_file = _thinking_settings_file(_json_dumps(settings_data))
 
     # Create SDK options
     options = ClaudeCodeOptions(
@@ -771,11 +944,11 @@ async def invoke_agent(
     try:
         repo_context = repo_search_context(task)
         if repo_context:
-            logging.getLogger('pilot.invoke').info(
+            logger.info(
                 f"[ENFORCED] Auto-injected search context for agent '{agent_name}'"
             )
     except Exception as e:
-        logging.getLogger('pilot.invoke').warning(f'repo_search context failed: {e}')
+        logger.warning(f'repo_search context failed: {e}')
         repo_context = ''
 
     # Additional context from agent-specific injection config (optional)
@@ -784,7 +957,7 @@ async def invoke_agent(
         try:
             extra_context = _process_context_injection(config, task)
         except Exception as e:
-            logging.getLogger('pilot.invoke').debug(f'Context injection failed: {e}')
+            logger.debug(f'Context injection failed: {e}')
             extra_context = ''
 
     # Combine: repo search context (mandatory) + agent-specific context (optional)
@@ -798,9 +971,11 @@ async def invoke_agent(
     enhanced_task = context_summary + task if context_summary else task
 
     # Execute query with retry logic for rate limits
-    output_text = ""
+    output_parts: list[str] = []  # Joined once at the end (avoids O(n^2) +=)
     tool_uses = []
+    saw_file_mod = False
     attempt = 0
+    backoff = None
     success = False
     error = None
 
@@ -809,8 +984,9 @@ async def invoke_agent(
     while True:
         try:
             # Reset for retry
-            output_text = ""
+            output_parts = []
             tool_uses = []
+            saw_file_mod = False
             messages_processed = 0
 
             async for message in query(prompt=enhanced_task, options=options):
@@ -820,12 +996,14 @@ async def invoke_agent(
                         if isinstance(block, TextBlock):
                             if verbose:
                                 print(block.text, end="", flush=True)
-                            output_text += block.text
+                            output_parts.append(block.text)
                         elif isinstance(block, ToolUseBlock):
                             tool_uses.append({
                                 "tool": block.name,
                                 "input": block.input if hasattr(block, 'input') else None,
                             })
+                            if block.name in FILE_MODIFYING_TOOLS:
+                                saw_file_mod = True
                             # Update progress when tool is used (shows activity)
                             if progress_project:
                                 update_heartbeat(
@@ -853,30 +1031,35 @@ async def invoke_agent(
                 # Rate limit - retry with backoff (never fail due to rate limits)
                 attempt += 1
                 retry_after = extract_retry_after(e)
-                backoff = calculate_backoff(attempt - 1, retry_after)  # attempt-1 for 0-indexed backoff calc
+                backoff = calculate_backoff(attempt - 1, retry_after, prev_backoff=backoff)  # attempt-1 for 0-indexed backoff calc
 
                 # Calculate total wait time so far for logging
                 elapsed = (datetime.now() - start_time).total_seconds()
 
-                # Determine backoff source for logging
-                source = f"Retry-After: {retry_after}s" if retry_after else "exponential backoff"
-
-                # Log the retry attempt (always log, not just verbose)
-                log_msg = (
-                    f"[Rate limited] Attempt {attempt}/{MAX_RETRY_ATTEMPTS}+ | "
-                    f"Waiting {backoff:.1f}s ({source}) | "
-                    f"Total elapsed: {elapsed:.1f}s"
-                )
-
-                if verbose:
-                    print(f"\n{log_msg}", flush=True)
-
-                # Also log to agent log for debugging
-                logging.getLogger("pilot.invoke").warning(
-                    f"Rate limit hit for agent '{agent_name}': {log_msg}"
-                )
-
+                # Log the retry attempt (always log, not just verbose); skip
+                # building the message when nobody will see it
+                log_enabled = logger.isEnabledFor(logging.WARNING)
+                if verbose or log_enabled:
+                    source = f"Retry-After: {retry_after}s" if retry_after else "decorrelated jitter"
+                    log_msg = (
+                        f"[Rate limited] Attempt {attempt}/{MAX_RETRY_ATTEMPTS}+ | "
+                        f"Waiting {backoff:.1f}s ({source}) | "
+                        f"Total elapsed: {elapsed:.1f}s"
+                    )
+
+                    if verbose:
+                        print(f"\n{log_msg}", flush=True)
+
+                    # Also log to agent log for debugging
+                    if log_enabled:
+                        logger.warning("Rate limit hit for agent '%s': %s", agent_name, log_msg)
+
+                # Each invocation waits out its own backoff (so Retry-After is
+                # honoured), then passes the gate one at a time so concurrent
+                # agents that hit the same 429 retry staggered, not all at once
                 await asyncio.sleep(backoff)
+                async with _get_rate_limit_gate():
+                    await asyncio.sleep(RETRY_SPACING_SECONDS)
                 # Continue loop - never fail due to rate limits
             else:
                 # Non-rate-limit error - fail immediately
@@ -884,6 +1067,8 @@ async def invoke_agent(
                 error = f"{type(e).__name__}: {str(e)}"
                 break
 
+    output_text = "".join(output_parts)
+
     # Calculate duration
     end_time = datetime.now()
     duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -912,7 +1097,7 @@ async def invoke_agent(
                     file_path = tool_use["input"].get("file_path")
                     if file_path:
                         artifacts.append(file_path)
-            # Create summary from first 200 chars of output
+            # Create summary from first 200 chars of output (bounded slice)
             summary = output_text[:200].strip() if output_text else "Completed successfully"
             if len(output_text) > 200:
                 summary += "..."
@@ -920,25 +1105,22 @@ async def invoke_agent(
         else:
             mark_failed(progress_project, run_id, error or "Unknown error")
 
-    # Process post_task hooks (fire-and-forget)
-    await _process_post_task_hooks(
+    # Process post_task hooks (errors are logged, not raised). Awaited
+    # unless the caller opted into running them in the background.
+    hook_kwargs = dict(
         config=config,
-        tool_uses=tool_uses,
+        file_changes=saw_file_mod,
         task=task,
         success=success,
         run_id=run_id,
         verbose=verbose,
     )
+    if background_hooks:
+        _schedule_post_task_hooks(**hook_kwargs)
+    else:
+        await _process_post_task_hooks(**hook_kwargs)
 
-    # Clean up temporary settings file if created
-    if cleanup_settings and settings_file:
-        try:
-            os.unlink(settings_file)
-            logger.debug(f"Cleaned up settings file: {settings_file}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up settings file {settings_file}: {e}")
-
-    # Log the invocation
+    # Log the invocation (queued; written by the log writer thread)
     log_agent(
         agent=agent_name,
         input={"task": task, "run_id": run_id},
@@ -947,12 +1129,12 @@ async def invoke_agent(
 
     # Create run manifest for project context (delegation tracking)
     if success:
-        _create_delegation_manifest(agent_name, task, run_id)
+        await asyncio.to_thread(_create_delegation_manifest, agent_name, task, run_id)
 
         # Track file attributions for audit trail
         try:
             from pilot_core.attribution import track_agent_files
-            tracked_count = track_agent_files(agent_name, tool_uses, run_id)
+            tracked_count = await asyncio.to_thread(track_agent_files, agent_name, tool_uses, run_id)
             if tracked_count > 0:
                 logger.debug(f"Tracked {tracked_count} file modifications for {agent_name}")
         except Exception as e:
@@ -964,12 +1146,18 @@ async def invoke_agent(
         if agent_name == "git-reviewer" and "APPROVED" in output_text:
             try:
                 from pilot_core.approve import record_reviewer_session
-                # Get current staged diff hash
-                diff_result = subprocess.run(
-                    ["git", "diff", "--cached"],
-                    capture_output=True,
+                # Get current staged diff hash (without blocking the event loop)
+                proc = await asyncio.create_subprocess_exec(
+                    "git", "diff", "--cached",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
-                diff_hash = hashlib.sha256(diff_result.stdout).hexdigest()
+                # Hash while git streams the diff rather than buffering it all
+                digest = hashlib.sha256()
+                while chunk := await proc.stdout.read(64 * 1024):
+                    digest.update(chunk)
+                await proc.wait()
+                diff_hash = digest.hexdigest()
                 record_reviewer_session(diff_hash)
                 logger.info(f"Recorded git-reviewer APPROVED session with diff hash {diff_hash[:16]}...")
             except Exception as e:
@@ -979,18 +1167,34 @@ async def invoke_agent(
 
 
 def invoke_sync(agent_name: str, task: str, **kwargs) -> dict:
-    """Synchronous wrapper for invoke_agent."""
-    return asyncio.run(invoke_agent(agent_name, task, **kwargs))
+    """Synchronous wrapper for invoke_agent.
 
+    Also waits for any background post_task hooks (background_hooks=True),
+    since asyncio.run would otherwise cancel them when the invocation returns.
+    """
+    async def _invoke_and_drain() -> dict:
+        result = await invoke_agent(agent_name, task, **kwargs)
+        await wait_for_post_task_hooks()
+        return result
 
-def main():
-    """CLI entry point for agent invocation."""
-    import argparse
+    return asyncio.run(_invoke_and_drain())
+
+
+_CLI_HELP = """\
+usage: python -m pilot_core.invoke [-h] [--run-id RUN_ID] [--verbose] [--list] [agent] [task]
+
+Invoke SDK-based agents
+
+positional arguments:
+  agent            Agent name (builder, web-researcher, git-reviewer)
+  task             Task description or JSON object
+
+options:
+  -h, --help       show this help message and exit
+  --run-id RUN_ID  Run ID to link this invocation
+  --verbose, -v    Stream output
+  --list, -l       List available agents
 
-    parser = argparse.ArgumentParser(
-        description="Invoke SDK-based agents",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
     # Invoke builder agent
     uv run python -m lib.invoke builder "Create a hello world tool"
@@ -1003,31 +1207,73 @@ Examples:
 
     # List available agents
     uv run python -m lib.invoke --list
-""",
-    )
+"""
+
+
+def _parse_cli_args(argv: list[str]) -> SimpleNamespace:
+    """Parse invoke CLI arguments without argparse (keeps CLI startup lean).
+
+    Accepts the same interface the argparse version did: up to two
+    positionals, --run-id VALUE / --run-id=VALUE, -v/--verbose, -l/--list,
+    -h/--help, and -- to end option parsing.
+    """
+    args = SimpleNamespace(agent=None, task=None, run_id=None, verbose=False, list=False)
+    positionals = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            positionals.extend(argv[i + 1:])
+            break
+        if arg in ("-h", "--help"):
+            print(_CLI_HELP, end="")
+            sys.exit(0)
+        elif arg in ("-v", "--verbose"):
+            args.verbose = True
+        elif arg in ("-l", "--list"):
+            args.list = True
+        elif arg == "--run-id":
+            if i + 1 >= len(argv):
+                _cli_usage_error("argument --run-id: expected one argument")
+            i += 1
+            args.run_id = argv[i]
+        elif arg.startswith("--run-id="):
+            args.run_id = arg.split("=", 1)[1]
+        elif arg.startswith("-") and arg != "-":
+            _cli_usage_error(f"unrecognized arguments: {arg}")
+        else:
+            positionals.append(arg)
+        i += 1
+
+    if len(positionals) > 2:
+        _cli_usage_error(f"unrecognized arguments: {' '.join(positionals[2:])}")
+    args.agent, args.task = (positionals + [None, None])[:2]
+    return args
 
-    parser.add_argument("agent", nargs="?", help="Agent name (builder, web-researcher, git-reviewer)")
-    parser.add_argument("task", nargs="?", help="Task description or JSON object")
-    parser.add_argument("--run-id", help="Run ID to link this invocation")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Stream output")
-    parser.add_argument("--list", "-l", action="store_true", help="List available agents")
 
-    args = parser.parse_args()
+def _cli_usage_error(message: str) -> NoReturn:
+    """Print usage plus an error to stderr and exit with status 2."""
+    print(_CLI_HELP.splitlines()[0], file=sys.stderr)
+    print(f"invoke: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def main():
+    """CLI entry point for agent invocation."""
+    args = _parse_cli_args(sys.argv[1:])
 
     if args.list:
         agents_dir = Path("agents")
         if agents_dir.exists():
             print("Available agents:")
             for f in agents_dir.glob("*.yaml"):
-                config = load_agent_config(f.stem)
-                desc = config.get("description", "") if config else ""
-                print(f"  {f.stem}: {desc}")
+                print(f"  {f.stem}: {load_agent_description(f.stem)}")
         else:
             print("No agents directory found")
         return
 
     if not args.agent:
-        parser.print_help()
+        print(_CLI_HELP, end="")
         sys.exit(1)
 
     if not args.task:
@@ -1051,12 +1297,16 @@ Examples:
         verbose=args.verbose,
     )
 
-    # Output result as JSON
-    if not args.verbose:
-        print(json.dumps(result, indent=2, default=str))
-    else:
+    # Output result as JSON. result is normally all JSON-native, so only fall
+    # back to the per-value default=str hook if serialization actually fails
+    try:
+        output = _json_dumps_indented(result)
+    except TypeError:
+        output = json.dumps(result, indent=2, ensure_ascii=False, default=str)
+
+    if args.verbose:
         print("\n---")
-        print(json.dumps(result, indent=2, default=str))
+    print(output)
 
 
 if __name__ == "__main__":
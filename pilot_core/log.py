@@ -1,10 +1,24 @@
-"""Logging utilities for agent and tool interactions."""
+"""Logging utilities for agent and tool interactions.
 
+Log entries are serialized on the calling thread and written to disk by a
+single background writer thread, so logging never blocks on file I/O.
+Pending entries are flushed at interpreter exit; call flush_logs() to wait
+for them explicitly.
+"""
+
+import atexit
 import json
-import os
+import queue
+import secrets
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from uuid import uuid4
+
+# (absolute log path, serialized entry) pairs awaiting the writer thread
+_log_queue: "queue.Queue[tuple[Path, str]]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_started = False
 
 
 def _ensure_dir(path: Path) -> None:
@@ -12,25 +26,58 @@ def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _log_worker() -> None:
+    """Drain the log queue, writing each entry to its file."""
+    while True:
+        log_path, content = _log_queue.get()
+        try:
+            _ensure_dir(log_path.parent)
+            log_path.write_text(content)
+        except OSError as e:
+            print(f"Failed to write log {log_path}: {e}", file=sys.stderr)
+        finally:
+            _log_queue.task_done()
+
+
+def _start_writer() -> None:
+    """Start the background writer thread on first use."""
+    global _writer_started
+    with _writer_lock:
+        if _writer_started:
+            return
+        threading.Thread(target=_log_worker, name="pilot-log-writer", daemon=True).start()
+        atexit.register(flush_logs)
+        _writer_started = True
+
+
+def flush_logs() -> None:
+    """Block until every queued log entry has been written."""
+    _log_queue.join()
+
+
 def _write_log(category: str, name: str, data: dict) -> str:
-    """Write a log entry and return the log path."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_id = str(uuid4())[:8]
+    """Queue a log entry for writing and return the log path."""
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    log_id = secrets.token_hex(4)
 
     log_dir = Path("logs") / category / name
-    _ensure_dir(log_dir)
 
     filename = f"{timestamp}_{log_id}.json"
     log_path = log_dir / filename
 
     log_entry = {
         "id": f"{timestamp}_{log_id}",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         **data
     }
 
-    with open(log_path, "w") as f:
-        json.dump(log_entry, f, indent=2, default=str)
+    # Serialize now so later mutation of data can't change what is logged;
+    # resolve the path now so a later chdir can't move where it is written
+    content = json.dumps(log_entry, indent=2, default=str)
+    if not _writer_started:
+        _start_writer()
+    _log_queue.put((log_path.absolute(), content))
 
     return str(log_path)
 
@@ -46,7 +93,7 @@ def log_agent(agent: str, input: dict, output: dict, context: dict = None) -> st
         context: Optional context information
 
     Returns:
-        Path to the log file
+        Path to the log file (written asynchronously)
     """
     data = {
         "agent": agent,
@@ -70,7 +117,7 @@ def log_tool(tool: str, input: dict, output: dict, context: dict = None) -> str:
         context: Optional context information
 
     Returns:
-        Path to the log file
+        Path to the log file (written asynchronously)
     """
     data = {
         "tool": tool,
@@ -5,15 +5,38 @@ Every agent invocation writes progress to .progress/{run_id}.yaml during executi
 Pilot can check these files to monitor progress without blocking.
 
 Progress file location: projects/{project}/.progress/{run_id}.yaml
+Summary index: projects/{project}/.progress/index.jsonl (append-only, one
+JSON line per status change or terminal write; compacted by cleanup_progress)
+
+Updates made through update_progress() are kept in an in-process cache and
+flushed to disk at most once per PROGRESS_FLUSH_INTERVAL seconds, or
+immediately when the run reaches a terminal status. A deferred update is
+written by a timer once the interval has passed, so the file on disk lags
+by at most PROGRESS_FLUSH_INTERVAL. Call flush_progress() to force pending
+updates out (this also happens at interpreter exit).
 """
 
-from dataclasses import dataclass, field
+import atexit
+import fcntl
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class ProgressStatus(Enum):
     """Status of an agent invocation."""
@@ -56,13 +79,65 @@ class ProgressFile:
     artifacts_created: list[str] = field(default_factory=list)
 
 
+def _status_from_value(value: str) -> ProgressStatus:
+    """Look up a ProgressStatus by value without going through Enum.__call__.
+
+    Unknown values fall through to ProgressStatus(value), which raises
+    ValueError as before.
+    """
+    return ProgressStatus._value2member_map_.get(value) or ProgressStatus(value)
+
+
+# Append-only summary index kept alongside the progress files
+PROGRESS_INDEX_NAME = 'index.jsonl'
+
+# Field names accepted by update_progress
+_PROGRESS_FIELDS = frozenset(f.name for f in fields(ProgressFile))
+
+# Minimum seconds between disk writes for non-terminal progress updates
+PROGRESS_FLUSH_INTERVAL = 0.5
+
+# Statuses that are always written through immediately
+_TERMINAL_STATUSES = frozenset({ProgressStatus.COMPLETED, ProgressStatus.FAILED})
+
+
+@dataclass
+class _CachedProgress:
+    """In-process copy of a progress file this process is updating."""
+    project: str
+    progress: ProgressFile
+    last_flush: float
+    signature: Optional[tuple] = None
+    dirty: bool = False
+    # Pending flush of a deferred update, armed when the entry goes dirty
+    timer: Optional[threading.Timer] = None
+    # Status as last written to disk, so the index only grows on changes
+    written_status: Optional[ProgressStatus] = None
+
+
+# Keyed by progress file path so redirected progress dirs never collide
+_progress_cache: dict[str, _CachedProgress] = {}
+_progress_lock = threading.RLock()
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """Return (mtime_ns, size, inode) for path, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@lru_cache(maxsize=128)
 def _get_progress_dir(project: str) -> Path:
-    """Get the .progress directory path for a project."""
-    return Path('projects') / project / '.progress'
+    """Get the .progress directory path for a project (memoized; Paths are immutable)."""
+    return Path('projects', project, '.progress')
 
 
+@lru_cache(maxsize=1024)
 def _get_progress_path(project: str, run_id: str) -> Path:
-    """Get the progress file path for a specific run."""
+    """Get the progress file path for a specific run (memoized for heartbeat/poll loops)."""
     return _get_progress_dir(project) / f'{run_id}.yaml'
 
 
@@ -91,7 +166,7 @@ def _dict_to_progress(data: dict) -> ProgressFile:
         agent=data['agent'],
         project=data['project'],
         started_at=datetime.fromisoformat(data['started_at']),
-        status=ProgressStatus(data['status']),
+        status=_status_from_value(data['status']),
         last_heartbeat=datetime.fromisoformat(data['last_heartbeat']),
         phase=data.get('phase', ''),
         messages_processed=data.get('messages_processed', 0),
@@ -118,12 +193,175 @@ def write_progress(project: str, progress: ProgressFile) -> Path:
     progress_dir.mkdir(parents=True, exist_ok=True)
 
     path = _get_progress_path(project, progress.run_id)
+    # Cache a copy so later mutation of the caller's object can't leak in
+    _write_progress_file(path, project, replace(progress))
+    return path
+
 
+def _write_progress_file(path: Path, project: str, progress: ProgressFile) -> None:
+    """Serialize progress to path and record it as this process's cached copy.
+
+    Writes to a temp file in the same directory and publishes it with
+    os.replace, so concurrent readers never see a half-written file.
+    """
     data = _progress_to_dict(progress)
-    with open(path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    # Dot-prefixed and not *.yaml, so list/cleanup globs never pick it up
+    tmp_path = path.with_name(f'.{path.name}.tmp.{os.getpid()}')
+    with _progress_lock:
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        prev = _progress_cache.get(str(path))
+        if (
+            prev is None
+            or prev.written_status != progress.status
+            or progress.status in _TERMINAL_STATUSES
+        ):
+            _append_index(path.parent, progress)
+
+        _progress_cache[str(path)] = _CachedProgress(
+            project=project,
+            progress=progress,
+            last_flush=time.monotonic(),
+            signature=_file_signature(path),
+            written_status=progress.status,
+        )
+
+
+def _index_record(progress: ProgressFile) -> str:
+    """Serialize the summary fields of progress as one index line."""
+    return json.dumps({
+        'run_id': progress.run_id,
+        'agent': progress.agent,
+        'project': progress.project,
+        'started_at': progress.started_at.isoformat(),
+        'status': progress.status.value,
+        'last_heartbeat': progress.last_heartbeat.isoformat(),
+        'phase': progress.phase,
+    }) + '\n'
 
-    return path
+
+def _append_index(progress_dir: Path, progress: ProgressFile) -> None:
+    """Append a summary line for progress to the directory's index.
+
+    Only called when a run is first written, changes status or is written
+    with a terminal status, so heartbeats don't grow the index.
+    """
+    fd = os.open(
+        str(progress_dir / PROGRESS_INDEX_NAME),
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+        0o644,
+    )
+    try:
+        # Same lock as _compact_index, so no append lands mid-compaction
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            os.write(fd, _index_record(progress).encode('utf-8'))
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _read_index(progress_dir: Path) -> dict[str, ProgressFile]:
+    """Read the summary index; the last line for each run_id wins."""
+    summaries: dict[str, ProgressFile] = {}
+    try:
+        with open(progress_dir / PROGRESS_INDEX_NAME, 'r') as f:
+            for line in f:
+                try:
+                    progress = _dict_to_progress(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    # Skip torn/invalid lines
+                    continue
+                summaries[progress.run_id] = progress
+    except FileNotFoundError:
+        pass
+    return summaries
+
+
+def _compact_index(
+    progress_dir: Path, survivors: list[ProgressFile], deleted_run_ids: list[str]
+) -> None:
+    """Rewrite the index with one line per surviving run.
+
+    Holds an exclusive flock on the index for the whole read-modify-write,
+    so lines appended by other writers since survivors were scanned are
+    merged in rather than lost. The rewrite is in place (not os.replace)
+    so appenders never write to an unlinked file; a reader racing it may
+    miss runs, which list_progress already tolerates.
+    """
+    with _progress_lock:
+        fd = os.open(str(progress_dir / PROGRESS_INDEX_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                records = {p.run_id: p for p in survivors}
+                records.update(_read_index(progress_dir))
+                for run_id in deleted_run_ids:
+                    records.pop(run_id, None)
+                data = ''.join(_index_record(p) for p in records.values()).encode('utf-8')
+                os.ftruncate(fd, 0)
+                os.pwrite(fd, data, 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def flush_progress(project: Optional[str] = None) -> int:
+    """Write any debounced progress updates to disk.
+
+    Args:
+        project: Only flush runs for this project (default: all projects)
+
+    Returns:
+        Number of progress files written
+    """
+    progress_dir = str(_get_progress_dir(project)) if project is not None else None
+    with _progress_lock:
+        pending = [
+            (key, entry) for key, entry in _progress_cache.items()
+            if entry.dirty and (progress_dir is None or os.path.dirname(key) == progress_dir)
+        ]
+        for key, entry in pending:
+            _write_progress_file(Path(key), entry.project, entry.progress)
+    return len(pending)
+
+
+def _flush_deferred(key: str) -> None:
+    """Timer callback: write a still-pending deferred update for key."""
+    with _progress_lock:
+        entry = _progress_cache.get(key)
+        if entry is None or not entry.dirty:
+            return
+        try:
+            _write_progress_file(Path(key), entry.project, entry.progress)
+        except OSError:
+            # Progress dir moved or removed meanwhile; flush_progress retries
+            entry.timer = None
+
+
+def _forget_progress(path: Path) -> None:
+    """Drop a cached progress entry (after its file is moved or deleted)."""
+    with _progress_lock:
+        _progress_cache.pop(str(path), None)
+
+
+def _flush_progress_at_exit() -> None:
+    """Best-effort flush of pending updates when the interpreter exits."""
+    try:
+        flush_progress()
+    except OSError:
+        pass
+
+
+atexit.register(_flush_progress_at_exit)
 
 
 def read_progress(project: str, run_id: str) -> Optional[ProgressFile]:
@@ -138,23 +376,51 @@ def read_progress(project: str, run_id: str) -> Optional[ProgressFile]:
     """
     path = _get_progress_path(project, run_id)
 
-    if not path.exists():
-        return None
+    # Unflushed updates from this process are newer than the file on disk
+    entry = _progress_cache.get(str(path))
+    if entry is not None and entry.dirty:
+        # A copy, so callers can't mutate the cached progress
+        return replace(entry.progress)
 
+    return _load_progress_file(path)
+
+
+def _load_progress_file(path: Path) -> Optional[ProgressFile]:
+    """Parse a progress file, returning None if it is missing or invalid."""
     try:
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return _dict_to_progress(data)
-    except (yaml.YAMLError, KeyError, ValueError):
-        # Return None for invalid/corrupted files
+    except FileNotFoundError:
+        return None
+    except (yaml.YAMLError, KeyError, ValueError, TypeError):
+        # Invalid/corrupted file
         return None
 
 
-def list_progress(project: str) -> list[ProgressFile]:
+def _scan_progress_files(directory: Path) -> list[Path]:
+    """List *.yaml regular files directly inside directory (single scandir pass)."""
+    try:
+        with os.scandir(directory) as it:
+            return [
+                Path(entry.path) for entry in it
+                if entry.name.endswith('.yaml') and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def list_progress(project: str, full: bool = True) -> list[ProgressFile]:
     """List all progress files for a project.
 
     Args:
         project: Project name
+        full: If False, build results from the summary index instead of
+            parsing every progress file. Only run_id, agent, project,
+            started_at, status, last_heartbeat and phase are populated.
+            The index is only appended on status changes, so finished runs
+            come from it while active runs (whose heartbeat and phase move)
+            and runs missing from it fall back to their file.
 
     Returns:
         List of ProgressFile objects, empty list if .progress/ doesn't exist
@@ -164,15 +430,18 @@ def list_progress(project: str) -> list[ProgressFile]:
     if not progress_dir.exists():
         return []
 
+    flush_progress(project)
+
+    summaries = {} if full else _read_index(progress_dir)
+
     progress_files = []
-    for path in progress_dir.glob('*.yaml'):
-        try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-            progress_files.append(_dict_to_progress(data))
-        except (yaml.YAMLError, KeyError, ValueError):
-            # Skip invalid/corrupted files
-            continue
+    for path in _scan_progress_files(progress_dir):
+        progress = summaries.get(path.stem)
+        if progress is None or progress.status not in _TERMINAL_STATUSES:
+            progress = _load_progress_file(path)
+        # Skip invalid/corrupted files
+        if progress is not None:
+            progress_files.append(progress)
 
     return progress_files
 
@@ -180,8 +449,10 @@ def list_progress(project: str) -> list[ProgressFile]:
 def update_progress(project: str, run_id: str, **updates) -> Optional[ProgressFile]:
     """Update specific fields in an existing progress file.
 
-    Reads the existing progress, merges updates, and writes back.
-    All updates preserve existing fields not being updated.
+    Merges updates into the existing progress. All updates preserve existing
+    fields not being updated. The file is re-read only if this process has
+    no cached copy or the file changed underneath it, and the write is
+    debounced by PROGRESS_FLUSH_INTERVAL unless the new status is terminal.
 
     Args:
         project: Project name
@@ -191,32 +462,90 @@ def update_progress(project: str, run_id: str, **updates) -> Optional[ProgressFi
     Returns:
         Updated ProgressFile, or None if original file doesn't exist
     """
-    progress = read_progress(project, run_id)
-    if progress is None:
-        return None
+    return _modify_progress(project, run_id, lambda progress: _apply_updates(progress, updates))
 
-    # Handle status as string or ProgressStatus
-    if 'status' in updates:
-        status_val = updates['status']
-        if isinstance(status_val, str):
-            updates['status'] = ProgressStatus(status_val)
 
-    # Apply updates to a dict representation
-    data = _progress_to_dict(progress)
-    for key, value in updates.items():
-        if key == 'status' and isinstance(value, ProgressStatus):
-            data[key] = value.value
-        elif key in ('started_at', 'last_heartbeat') and isinstance(value, datetime):
-            data[key] = value.isoformat()
+def bump_messages(project: str, run_id: str, n: int = 1) -> Optional[ProgressFile]:
+    """Increment messages_processed without touching any other field.
+
+    Goes through the same debounced cache as update_progress, so a burst
+    of bumps costs one disk write per PROGRESS_FLUSH_INTERVAL.
+
+    Args:
+        project: Project name
+        run_id: Run identifier
+        n: Amount to add (default 1)
+
+    Returns:
+        Updated ProgressFile, or None if original file doesn't exist
+    """
+    return _modify_progress(
+        project, run_id,
+        lambda progress: replace(progress, messages_processed=progress.messages_processed + n),
+    )
+
+
+def _modify_progress(
+    project: str,
+    run_id: str,
+    modify: Callable[[ProgressFile], ProgressFile],
+) -> Optional[ProgressFile]:
+    """Apply modify to the current progress and store or debounce the result."""
+    path = _get_progress_path(project, run_id)
+
+    with _progress_lock:
+        entry = _progress_cache.get(str(path))
+        if entry is not None and (entry.dirty or _file_signature(path) == entry.signature):
+            progress = entry.progress
         else:
-            data[key] = value
+            entry = None
+            progress = read_progress(project, run_id)
+            if progress is None:
+                return None
+
+        updated = modify(progress)
+
+        now = time.monotonic()
+        if (
+            entry is None
+            or updated.status in _TERMINAL_STATUSES
+            or now - entry.last_flush >= PROGRESS_FLUSH_INTERVAL
+        ):
+            _write_progress_file(path, project, updated)
+        else:
+            entry.progress = updated
+            entry.dirty = True
+            if entry.timer is None:
+                # Make sure the update reaches disk even if no further
+                # update arrives to carry it
+                remaining = PROGRESS_FLUSH_INTERVAL - (now - entry.last_flush)
+                entry.timer = threading.Timer(remaining, _flush_deferred, args=(str(path),))
+                entry.timer.daemon = True
+                entry.timer.start()
 
-    # Convert back and write
-    updated = _dict_to_progress(data)
-    write_progress(project, updated)
     return updated
 
 
+def _apply_updates(progress: ProgressFile, updates: dict) -> ProgressFile:
+    """Return a new ProgressFile with updates merged over progress.
+
+    Values stay as Python objects; ISO/enum string conversion only happens
+    when the progress is written to disk. Strings are still accepted for
+    status and timestamps. Unknown keys are ignored.
+    """
+    changes = {}
+    for key, value in updates.items():
+        if key not in _PROGRESS_FIELDS:
+            continue
+        if key == 'status' and isinstance(value, str):
+            value = _status_from_value(value)
+        elif key in ('started_at', 'last_heartbeat') and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        changes[key] = value
+
+    return replace(progress, **changes)
+
+
 def update_heartbeat(
     project: str,
     run_id: str,
@@ -234,7 +563,7 @@ def update_heartbeat(
     Returns:
         Updated ProgressFile, or None if original file doesn't exist
     """
-    updates: dict = {'last_heartbeat': datetime.now().isoformat()}
+    updates: dict = {'last_heartbeat': datetime.now()}
 
     if phase is not None:
         updates['phase'] = phase
@@ -262,8 +591,8 @@ def mark_completed(
         Updated ProgressFile, or None if original file doesn't exist
     """
     updates: dict = {
-        'status': ProgressStatus.COMPLETED.value,
-        'last_heartbeat': datetime.now().isoformat(),
+        'status': ProgressStatus.COMPLETED,
+        'last_heartbeat': datetime.now(),
         'result_summary': result_summary,
     }
 
@@ -287,8 +616,8 @@ def mark_failed(project: str, run_id: str, error: str) -> Optional[ProgressFile]
     return update_progress(
         project,
         run_id,
-        status=ProgressStatus.FAILED.value,
-        last_heartbeat=datetime.now().isoformat(),
+        status=ProgressStatus.FAILED,
+        last_heartbeat=datetime.now(),
         error=error
     )
 
@@ -318,6 +647,82 @@ class AgentNotFoundError(Exception):
     pass
 
 
+class _ProgressFileWatcher:
+    """Wait for a specific progress file to change using Linux inotify.
+
+    Watches the progress directory (atomic writes replace the file, so the
+    directory sees IN_MOVED_TO) and wakes only for events naming the file.
+    Use open() to construct; it returns None where inotify is unavailable.
+    """
+
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, fd: int, filename: str):
+        self._fd = fd
+        self._filename = os.fsencode(filename)
+
+    @classmethod
+    def open(cls, directory: Path, filename: str) -> Optional['_ProgressFileWatcher']:
+        """Start watching directory for changes to filename, or return None."""
+        if not sys.platform.startswith('linux') or not directory.is_dir():
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(cls._IN_NONBLOCK | cls._IN_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = cls._IN_CLOSE_WRITE | cls._IN_MOVED_TO | cls._IN_CREATE
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return cls(fd, filename)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the file changes or timeout elapses.
+
+        Returns:
+            True if the file changed, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return False
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            if self._names_file(buf):
+                return True
+
+    def _names_file(self, buf: bytes) -> bool:
+        """Check whether any inotify event in buf refers to the watched file."""
+        offset = 0
+        header_size = self._EVENT_HEADER.size
+        while offset + header_size <= len(buf):
+            _, _, _, name_len = self._EVENT_HEADER.unpack_from(buf, offset)
+            name = buf[offset + header_size:offset + header_size + name_len].rstrip(b'\0')
+            if name == self._filename:
+                return True
+            offset += header_size + name_len
+        return False
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        os.close(self._fd)
+
+
 def wait_for_agent(
     project: str,
     run_id: str,
@@ -327,14 +732,16 @@ def wait_for_agent(
 ) -> ProgressFile:
     """Wait for a background agent to complete.
 
-    Polls the progress file until the agent completes, fails, or times out.
-    Detects stale agents that have stopped updating their heartbeat.
+    Re-reads the progress file until the agent completes, fails, or times out.
+    On Linux it wakes as soon as the file is rewritten (inotify); elsewhere it
+    polls every poll_interval. Detects stale agents that have stopped
+    updating their heartbeat.
 
     Args:
         project: Project name
         run_id: Run identifier
         timeout: Maximum seconds to wait (default 600 = 10 minutes)
-        poll_interval: Seconds between polls (default 5)
+        poll_interval: Max seconds between checks (default 5)
         stale_threshold: Minutes without heartbeat to consider stale (default 5)
 
     Returns:
@@ -345,43 +752,60 @@ def wait_for_agent(
         StaleAgentError: If agent appears stuck (no heartbeat updates)
         AgentNotFoundError: If progress file doesn't exist
     """
-    import time
-
     start_time = time.time()
-    terminal_statuses = {ProgressStatus.COMPLETED, ProgressStatus.FAILED}
-
-    while True:
-        elapsed = time.time() - start_time
-
-        # Read progress
-        progress = read_progress(project, run_id)
-        if progress is None:
-            # Give some grace period for file creation
-            if elapsed < poll_interval * 2:
-                time.sleep(poll_interval)
-                continue
-            raise AgentNotFoundError(f"Progress file not found for run_id: {run_id}")
-
-        # Check timeout (only after we've confirmed file exists)
-        if elapsed > timeout:
-            raise TimeoutError(
-                f"Agent {run_id} did not complete within {timeout}s. "
-                f"Last status: {progress.status.value if progress else 'unknown'}"
-            )
-
-        # Check if completed or failed
-        if progress.status in terminal_statuses:
-            return progress
-
-        # Check for stale agent
-        if is_stale(progress, stale_threshold):
-            raise StaleAgentError(
-                f"Agent {run_id} appears stuck. No heartbeat in {stale_threshold} minutes. "
-                f"Last phase: {progress.phase}"
-            )
+    terminal_statuses = _TERMINAL_STATUSES
+    progress_path = _get_progress_path(project, run_id)
+    # Start watching before the first read so no write can slip in between
+    watcher = _ProgressFileWatcher.open(progress_path.parent, progress_path.name)
+
+    def wait_for_change() -> None:
+        # Wake on the next write to the progress file where inotify is
+        # available; poll_interval still bounds the wait so the timeout and
+        # stale checks keep running
+        nonlocal watcher
+        if watcher is None:
+            watcher = _ProgressFileWatcher.open(progress_path.parent, progress_path.name)
+        if watcher is not None:
+            watcher.wait(poll_interval)
+        else:
+            time.sleep(poll_interval)
 
-        # Wait before next poll
-        time.sleep(poll_interval)
+    try:
+        while True:
+            elapsed = time.time() - start_time
+
+            # Read progress
+            progress = read_progress(project, run_id)
+            if progress is None:
+                # Give some grace period for file creation
+                if elapsed < poll_interval * 2:
+                    wait_for_change()
+                    continue
+                raise AgentNotFoundError(f"Progress file not found for run_id: {run_id}")
+
+            # Check timeout (only after we've confirmed file exists)
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Agent {run_id} did not complete within {timeout}s. "
+                    f"Last status: {progress.status.value if progress else 'unknown'}"
+                )
+
+            # Check if completed or failed
+            if progress.status in terminal_statuses:
+                return progress
+
+            # Check for stale agent
+            if is_stale(progress, stale_threshold):
+                raise StaleAgentError(
+                    f"Agent {run_id} appears stuck. No heartbeat in {stale_threshold} minutes. "
+                    f"Last phase: {progress.phase}"
+                )
+
+            # Wait for the next change (or poll_interval) before re-reading
+            wait_for_change()
+    finally:
+        if watcher is not None:
+            watcher.close()
 
 
 def cleanup_progress(
@@ -417,6 +841,8 @@ def cleanup_progress(
             'kept_failed': 0,
         }
 
+    flush_progress(project)
+
     now = datetime.now()
     cutoff = now - timedelta(hours=max_age_hours)
 
@@ -424,16 +850,15 @@ def cleanup_progress(
     deleted_run_ids = []
     kept_count = 0
     kept_failed = 0
+    survivors = []
 
-    for path in progress_dir.glob('*.yaml'):
-        # Skip archive directory
-        if path.parent.name == 'archive':
-            continue
-
-        progress = read_progress(project, path.stem)
+    # Only direct children are scanned, so archive/ is never visited
+    for path in _scan_progress_files(progress_dir):
+        progress = _load_progress_file(path)
         if progress is None:
-            # Corrupted file - delete it
-            path.unlink()
+            # Corrupted (or concurrently removed) file - delete it
+            path.unlink(missing_ok=True)
+            _forget_progress(path)
             deleted_count += 1
             deleted_run_ids.append(path.stem)
             continue
@@ -445,15 +870,21 @@ def cleanup_progress(
         if progress.status == ProgressStatus.FAILED and keep_failed:
             kept_count += 1
             kept_failed += 1
+            survivors.append(progress)
             continue
 
         # Only delete completed files that are old enough
         if progress.status == ProgressStatus.COMPLETED and is_old:
             path.unlink()
+            _forget_progress(path)
             deleted_count += 1
             deleted_run_ids.append(progress.run_id)
         else:
             kept_count += 1
+            survivors.append(progress)
+
+    # Compact the summary index down to the surviving runs
+    _compact_index(progress_dir, survivors, deleted_run_ids)
 
     return {
         'deleted_count': deleted_count,
@@ -479,6 +910,11 @@ def archive_progress(project: str, run_id: str) -> Optional[Path]:
     progress_dir = _get_progress_dir(project)
     source_path = _get_progress_path(project, run_id)
 
+    # Archive the latest state, not a debounced older one
+    entry = _progress_cache.get(str(source_path))
+    if entry is not None and entry.dirty:
+        _write_progress_file(source_path, project, entry.progress)
+
     if not source_path.exists():
         return None
 
@@ -489,6 +925,7 @@ def archive_progress(project: str, run_id: str) -> Optional[Path]:
     # Move file to archive
     dest_path = archive_dir / f'{run_id}.yaml'
     source_path.rename(dest_path)
+    _forget_progress(source_path)
 
     return dest_path
 
@@ -508,13 +945,10 @@ def list_archived_progress(project: str) -> list[ProgressFile]:
         return []
 
     progress_files = []
-    for path in archive_dir.glob('*.yaml'):
-        try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-            progress_files.append(_dict_to_progress(data))
-        except (yaml.YAMLError, KeyError, ValueError):
-            # Skip invalid/corrupted files
-            continue
+    for path in _scan_progress_files(archive_dir):
+        progress = _load_progress_file(path)
+        # Skip invalid/corrupted files
+        if progress is not None:
+            progress_files.append(progress)
 
     return progress_files
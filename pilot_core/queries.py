@@ -34,6 +34,38 @@ QUERIES_DIR = Path("system/queries")
 INDEX_PATH = Path("data/index.json")
 
 
+def escape_like(text: str) -> str:
+    """
+    Escape LIKE wildcards so text matches literally.
+
+    Use the result in a pattern compared with ``LIKE ... ESCAPE '\\'``.
+
+    Args:
+        text: Literal text to embed in a LIKE pattern
+
+    Returns:
+        Text with backslash, % and _ escaped by a backslash
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def json_path(field: str) -> str:
+    """
+    Build a JSON path selecting one top-level key.
+
+    Bind the result as a parameter to ``json_extract_string(column, ?)``
+    so field names never become part of the SQL text.
+
+    Args:
+        field: Key name; dots and quotes are treated as part of the name
+
+    Returns:
+        JSON path such as ``$."field"``
+    """
+    escaped = field.replace("\\", "\\\\").replace('"', '\\"')
+    return f'$."{escaped}"'
+
+
 class QueryError(Exception):
     """Raised when query loading or execution fails."""
     pass
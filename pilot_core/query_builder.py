@@ -28,6 +28,8 @@ Usage:
 
 from typing import Optional, Any
 
+from pilot_core.queries import escape_like, json_path
+
 
 class QueryBuilder:
     """Fluent query builder for the pilot index."""
@@ -104,11 +106,35 @@ class QueryBuilder:
         self._params[param] = pattern
         return self
 
+    def starts_with(self, field: str, prefix: str) -> 'QueryBuilder':
+        """
+        Filter by literal prefix match.
+
+        Unlike where_like(), % and _ in the prefix match themselves. The
+        anchored pattern lets DuckDB skip row groups whose min/max values
+        rule out the prefix.
+
+        Args:
+            field: Field name to match against
+            prefix: Literal prefix the field must start with
+
+        Returns:
+            Self for chaining
+
+        Example:
+            QueryBuilder().starts_with('name', 'web_').execute()
+        """
+        param = self._next_param()
+        self._where_conditions.append((field, 'PREFIX', param))
+        self._params[param] = f"{escape_like(prefix)}%"
+        return self
+
     def search(self, query: str) -> 'QueryBuilder':
         """
         Full-text search across name, description, and text content.
 
-        Matches are case-insensitive and partial.
+        Matches are case-insensitive and partial; % and _ in the query
+        match themselves.
 
         Args:
             query: Search term
@@ -201,18 +227,6 @@ class QueryBuilder:
         Example:
             sql, params = QueryBuilder().type('agent').to_sql()
         """
-        # Base query - use 'unnest' as alias to match existing SQL templates
-        sql_parts = [
-            "SELECT",
-            "    unnest.path,",
-            "    unnest.name,",
-            "    unnest.type,",
-            "    unnest.description,",
-            "    unnest.content",
-            "FROM read_json_auto('data/index.json', maximum_object_size=100000000),",
-            "UNNEST(items) as unnest"
-        ]
-
         where_clauses = []
         params = dict(self._params)
 
@@ -225,30 +239,64 @@ class QueryBuilder:
         for field, op, param_name in self._where_conditions:
             # Map simple field names to unnest.field
             if field in ('name', 'path', 'type', 'description'):
-                where_clauses.append(f"unnest.{field} {op} :{param_name}")
+                column = f"unnest.{field}"
+            else:
+                # For other fields, try JSON access; the path is bound so
+                # the field name never enters the SQL text
+                path_param = f"{param_name}_path"
+                params[path_param] = json_path(field)
+                column = f"json_extract_string(unnest.content, :{path_param})"
+            if op == 'PREFIX':
+                where_clauses.append(f"{column} LIKE :{param_name} ESCAPE '\\'")
             else:
-                # For other fields, try JSON access
-                where_clauses.append(f"unnest.content->>{repr(field)} {op} :{param_name}")
+                where_clauses.append(f"{column} {op} :{param_name}")
 
-        # Full-text search
+        # Full-text search; patterns are lowercased here once rather than
+        # by lower() at every comparison in the SQL
         if self._search_term:
-            params['search_term'] = f"%{self._search_term}%"
+            params['search_term'] = f"%{escape_like(self._search_term.lower())}%"
             where_clauses.append(
-                "(lower(unnest.name) LIKE lower(:search_term) "
-                "OR lower(COALESCE(unnest.description, '')) LIKE lower(:search_term) "
-                "OR lower(CAST(COALESCE(unnest.text, '') AS VARCHAR)) LIKE lower(:search_term))"
+                "(lower(unnest.name) LIKE :search_term ESCAPE '\\' "
+                "OR lower(COALESCE(unnest.description, '')) LIKE :search_term ESCAPE '\\' "
+                "OR lower(CAST(COALESCE(unnest.text, '') AS VARCHAR)) LIKE :search_term ESCAPE '\\')"
             )
 
         # Content search
         if self._content_search:
-            params['content_search'] = f"%{self._content_search}%"
+            params['content_search'] = f"%{escape_like(self._content_search.lower())}%"
             where_clauses.append(
-                "lower(CAST(unnest.content AS VARCHAR)) LIKE lower(:content_search)"
+                "lower(CAST(unnest.content AS VARCHAR)) LIKE :content_search ESCAPE '\\'"
             )
 
-        # Build WHERE clause
+        # Base query - use 'unnest' as alias to match existing SQL templates
+        sql_parts = [
+            "SELECT",
+            "    unnest.path,",
+            "    unnest.name,",
+            "    unnest.type,",
+            "    unnest.description,",
+            "    unnest.content",
+        ]
+
         if where_clauses:
-            sql_parts.append("WHERE " + " AND ".join(where_clauses))
+            # Filter the items list before unnesting it, so items that fail
+            # the conditions are never exploded into rows. The lambda
+            # parameter is also named 'unnest', so the conditions read the
+            # same either way; each is parenthesized so its operators
+            # don't bind to the lambda arrow.
+            sql_parts.extend([
+                "FROM (",
+                "    SELECT UNNEST(list_filter(items, unnest ->",
+                "        " + "\n        AND ".join(f"({clause})" for clause in where_clauses),
+                "    )) as unnest",
+                "    FROM read_json_auto('data/index.json', maximum_object_size=100000000)",
+                ") filtered",
+            ])
+        else:
+            sql_parts.extend([
+                "FROM read_json_auto('data/index.json', maximum_object_size=100000000),",
+                "UNNEST(items) as unnest",
+            ])
 
         # ORDER BY
         if self._order_field:
@@ -257,7 +305,8 @@ class QueryBuilder:
         elif self._search_term:
             # Default ordering for search: prioritize name matches
             sql_parts.append(
-                "ORDER BY CASE WHEN lower(unnest.name) LIKE lower(:search_term) THEN 0 ELSE 1 END, unnest.name"
+                "ORDER BY CASE WHEN lower(unnest.name) LIKE :search_term ESCAPE '\\' "
+                "THEN 0 ELSE 1 END, unnest.name"
             )
         else:
             # Default ordering by name
@@ -25,122 +25,297 @@ This module auto-rebuilds the index if missing or stale.
 
 import ast
 import json
+import math
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import duckdb
 
-from .embed import embed
+from .embed import EMBEDDING_DIM, embed
 from .index import index_all
+from .queries import escape_like, json_path
 
 INDEX_PATH = Path("data/index.json")
 
 # Auto-rebuild threshold: if index is older than this many seconds, rebuild
 INDEX_STALE_SECONDS = 3600  # 1 hour
 
+# Seconds between index age checks (well inside INDEX_STALE_SECONDS)
+INDEX_CHECK_INTERVAL = 60
+_last_index_check = float("-inf")
+
+# Bytes read from the top of the index when checking its age
+INDEX_HEAD_BYTES = 4096
+
+# generated_at as the first key of the top-level object
+_GENERATED_AT_RE = re.compile(rb'\s*\{\s*"generated_at"\s*:\s*"([^"\\]*)"')
+
+# context_for() skips semantic search when keyword search already returned at
+# least this many results with a top score at or above this
+CONTEXT_SATURATION_COUNT = 3
+CONTEXT_SATURATION_SCORE = 15
+
+
+def _read_generated_at() -> str:
+    """Read the index's top-level generated_at without parsing the whole file.
+
+    The index writers emit generated_at as the first key, so it is read from
+    the head of the file; anything else falls back to a full parse.
+    """
+    with open(INDEX_PATH, "rb") as f:
+        head = f.read(INDEX_HEAD_BYTES)
+    match = _GENERATED_AT_RE.match(head)
+    if match:
+        return match.group(1).decode()
+
+    with open(INDEX_PATH) as f:
+        return json.load(f).get("generated_at", "")
+
 
 def _ensure_index() -> bool:
-    """Ensure the index exists and is reasonably fresh. Auto-rebuild if needed."""
+    """Ensure the index exists and is reasonably fresh. Auto-rebuild if needed.
+
+    A missing index is always built; the age check runs at most once every
+    INDEX_CHECK_INTERVAL seconds.
+    """
+    global _last_index_check
+
     if not INDEX_PATH.exists():
         print("Index not found, building...")
         index_all()
         return True
 
+    now = time.monotonic()
+    if now - _last_index_check < INDEX_CHECK_INTERVAL:
+        return True
+    _last_index_check = now
+
     # Check if index is stale
     try:
-        with open(INDEX_PATH) as f:
-            data = json.load(f)
-            generated_at = data.get("generated_at", "")
-            if generated_at:
-                gen_time = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
-                age = (datetime.now() - gen_time.replace(tzinfo=None)).total_seconds()
-                if age > INDEX_STALE_SECONDS:
-                    print(f"Index is {age/3600:.1f}h old, rebuilding...")
-                    index_all()
-                    return True
+        generated_at = _read_generated_at()
+        if generated_at:
+            gen_time = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
+            age = (datetime.now() - gen_time.replace(tzinfo=None)).total_seconds()
+            if age > INDEX_STALE_SECONDS:
+                print(f"Index is {age/3600:.1f}h old, rebuilding...")
+                index_all()
+                return True
     except Exception:
         pass  # If we can't check, assume it's fine
 
     return True
 
 
-def _get_connection() -> duckdb.DuckDBPyConnection:
-    """Get a DuckDB connection with the index loaded."""
-    _ensure_index()
+# Shared in-memory database holding the materialized index, rebuilt whenever
+# the index file changes (keyed by its mtime)
+_CONN: Optional[duckdb.DuckDBPyConnection] = None
+_CONN_MTIME: Optional[int] = None
+_CONN_LOCK = threading.Lock()
+
+
+def _snapshot_path() -> Path:
+    """Path of the persisted DuckDB copy of the index (data/index.duckdb)."""
+    return INDEX_PATH.with_suffix(".duckdb")
 
-    con = duckdb.connect(":memory:")
 
-    if INDEX_PATH.exists():
-        con.execute(f"""
-            CREATE VIEW index_items AS
-            SELECT * FROM (
+def _load_index_table(con: duckdb.DuckDBPyConnection) -> None:
+    """Materialize the unnested index items into the index_items table.
+
+    Alongside each item, content is stored pre-serialized (content_str),
+    the fields keyword() matches on are stored lowercased (the *_lc
+    columns), and embeddings are L2-normalized and packed into fixed-size
+    FLOAT arrays (embedding_vec, NULL for other dimensions or zero vectors),
+    so searches don't re-serialize JSON, re-lowercase the whole corpus, walk
+    variable-length lists or recompute vector norms on every call.
+    """
+    con.execute(
+        f"""
+        CREATE TABLE index_items AS
+        SELECT
+            item,
+            CAST(item.content AS VARCHAR) as content_str,
+            lower(item.name) as name_lc,
+            lower(COALESCE(item.description, '')) as description_lc,
+            lower(COALESCE(item.text, '')) as text_lc,
+            lower(content_str) as content_lc,
+            lower(CAST(item.tags AS VARCHAR)) as tags_lc,
+            TRY_CAST(
+                CASE WHEN embedding_norm > 0
+                THEN list_transform(item.embedding, x -> x / embedding_norm)
+                END AS FLOAT[{EMBEDDING_DIM}]
+            ) as embedding_vec
+        FROM (
+            SELECT
+                item,
+                sqrt(list_sum(list_transform(item.embedding, x -> x * x))) as embedding_norm
+            FROM (
                 SELECT unnest(items) as item
-                FROM read_json_auto('{INDEX_PATH}', maximum_object_size=200000000)
+                FROM read_json_auto(?, maximum_object_size=200000000)
             )
-        """)
+        )
+        """,
+        [str(INDEX_PATH)],
+    )
 
-    return con
 
+def build_index_snapshot() -> Path:
+    """Persist the materialized index next to index.json as a DuckDB file.
 
-# =============================================================================
-# CORE SEARCH METHODS
-# =============================================================================
+    The snapshot records the mtime and size of the index.json it was built
+    from, so searches in later processes can open it instead of parsing
+    the JSON, and ignore it once index.json changes. It is written to a
+    temp file and renamed into place, so readers never see a partial file.
 
+    Returns:
+        Path to the snapshot file
+    """
+    st = INDEX_PATH.stat()
+    path = _snapshot_path()
+    tmp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+    tmp_path.unlink(missing_ok=True)
 
-def keyword(
-    query: str, types: Optional[list[str]] = None, limit: int = 20
-) -> list[dict]:
+    con = duckdb.connect(str(tmp_path))
+    try:
+        _load_index_table(con)
+        con.execute(
+            "CREATE TABLE index_meta AS SELECT ?::BIGINT as source_mtime_ns, ?::BIGINT as source_size",
+            [st.st_mtime_ns, st.st_size],
+        )
+    finally:
+        con.close()
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def _open_snapshot(mtime_ns: int, size: int) -> Optional[duckdb.DuckDBPyConnection]:
+    """Open the index snapshot if it was built from the current index.json.
+
+    The file is ATTACHed read-only to a fresh in-memory database rather
+    than opened with duckdb.connect(path): connect() reuses any instance
+    already open for that path in this process, which after a rebuild
+    would still be the replaced file.
     """
-    Multi-term keyword search across all indexed content.
+    path = _snapshot_path()
+    if not path.exists():
+        return None
 
-    Searches: name, description, text, content, tags
-    Scores results by relevance (name matches score highest).
+    con = duckdb.connect(":memory:")
+    try:
+        # ATTACH takes no bound parameters, so quote the path literal
+        quoted = str(path).replace("'", "''")
+        con.execute(f"ATTACH '{quoted}' AS snapshot (READ_ONLY)")
+        meta = con.execute("SELECT source_mtime_ns, source_size FROM snapshot.index_meta").fetchone()
+        if meta != (mtime_ns, size):
+            con.close()
+            return None
+        con.execute("CREATE VIEW index_items AS SELECT * FROM snapshot.index_items")
+    except duckdb.Error:
+        con.close()
+        return None
+    return con
 
-    Args:
-        query: Search query (can be multi-word)
-        types: Optional list of types to filter by
-        limit: Maximum results
 
-    Returns:
-        List of dicts with: path, name, type, description, score, content
+def _get_connection() -> duckdb.DuckDBPyConnection:
+    """Get a DuckDB connection with the index loaded.
+
+    The index is served from the data/index.duckdb snapshot, (re)built from
+    index.json when missing or stale; if the snapshot can't be written, the
+    JSON is parsed into an in-memory table instead. Either way it is reused
+    until index.json changes. Each call returns its own cursor on the
+    shared database, so callers on different threads don't share a
+    connection.
     """
-    if not INDEX_PATH.exists():
-        _ensure_index()
+    global _CONN, _CONN_MTIME
 
-    con = _get_connection()
+    _ensure_index()
 
-    # Build type filter
-    type_filter = ""
-    if types:
-        type_list = ", ".join(f"'{t}'" for t in types)
-        type_filter = f"AND type IN ({type_list})"
+    try:
+        st = INDEX_PATH.stat()
+    except OSError:
+        return duckdb.connect(":memory:")
+
+    with _CONN_LOCK:
+        if _CONN is None or _CONN_MTIME != st.st_mtime_ns:
+            con = _open_snapshot(st.st_mtime_ns, st.st_size)
+            if con is None:
+                try:
+                    build_index_snapshot()
+                    con = _open_snapshot(st.st_mtime_ns, st.st_size)
+                except (OSError, duckdb.Error):
+                    con = None
+            if con is None:
+                con = duckdb.connect(":memory:")
+                _load_index_table(con)
+            # The old database is left to the garbage collector: closing it
+            # would break cursors other callers are still using
+            _CONN, _CONN_MTIME = con, st.st_mtime_ns
+        return _CONN.cursor()
+
+
+@lru_cache(maxsize=1024)
+def _embed_cached(normalized: str) -> tuple[float, ...]:
+    """Embed already-normalized query text; cached per distinct query.
+
+    The vector is scaled to unit length, so its inner product with the
+    unit-length index embeddings is their cosine similarity.
+    """
+    vector = embed(normalized) or ()
+    magnitude = math.sqrt(sum(x * x for x in vector))
+    if magnitude == 0:
+        return ()
+    return tuple(x / magnitude for x in vector)
 
-    # Split query into terms
-    terms = [t.strip() for t in query.split() if len(t.strip()) >= 2]
-    if not terms:
-        terms = [query]
 
-    # Build scoring expression
-    score_parts = []
-    params = []
-    for term in terms[:5]:
-        score_parts.append("""
-            CASE
-                WHEN lower(item.name) LIKE lower('%' || ? || '%') THEN 10
-                WHEN lower(item.description) LIKE lower('%' || ? || '%') THEN 5
-                WHEN lower(COALESCE(item.text, '')) LIKE lower('%' || ? || '%') THEN 3
-                WHEN lower(CAST(item.content AS VARCHAR)) LIKE lower('%' || ? || '%') THEN 2
-                WHEN lower(CAST(item.tags AS VARCHAR)) LIKE lower('%' || ? || '%') THEN 1
-                ELSE 0
-            END
-        """)
-        params.extend([term, term, term, term, term])
-
-    score_expr = " + ".join(score_parts) if score_parts else "0"
-
-    sql = f"""
+def _embed_query(query: str) -> Optional[list[float]]:
+    """Embed a search query, reusing the embedding of equivalent queries.
+
+    Queries differing only in case or whitespace share a cache entry; the
+    embedding tokenizes lowercased words, so they embed identically.
+    """
+    vector = _embed_cached(" ".join(query.lower().split()))
+    return list(vector) if vector else None
+
+
+# =============================================================================
+# QUERY TEMPLATES
+# =============================================================================
+#
+# Search SQL is built once at import with a fixed parameter layout, so each
+# call only binds values. Type filters take a VARCHAR[] parameter (NULL means
+# no filter) instead of splicing quoted names into the query text.
+#
+# Ranked templates end in ORDER BY score DESC LIMIT ?, which DuckDB runs as a
+# TOP_N (a bounded heap, not a full sort) and, for small limits, scores on
+# the narrow columns first and only projects the surviving rows. Keep the
+# ORDER BY and LIMIT at the same level so that plan isn't lost.
+
+# Maximum number of query terms scored by keyword()
+KEYWORD_TERM_SLOTS = 5
+
+_TYPE_FILTER = "(CAST(? AS VARCHAR[]) IS NULL OR list_contains(?, {column}))"
+_EXCLUDE_FILTER = "(CAST(? AS VARCHAR[]) IS NULL OR NOT list_contains(?, {column}))"
+
+# Best field match for one term (name > description > text > content > tags).
+# Patterns arrive already lowercased; a NULL pattern scores 0.
+_KEYWORD_TERM_SCORE = """
+                COALESCE(greatest(
+                    10 * (name_lc LIKE ? ESCAPE '\\')::INTEGER,
+                    5 * (description_lc LIKE ? ESCAPE '\\')::INTEGER,
+                    3 * (text_lc LIKE ? ESCAPE '\\')::INTEGER,
+                    2 * (content_lc LIKE ? ESCAPE '\\')::INTEGER,
+                    1 * (tags_lc LIKE ? ESCAPE '\\')::INTEGER
+                ), 0)
+            """
+
+_KEYWORD_SQL = f"""
         SELECT path, name, type, description, score, content
         FROM (
             SELECT
@@ -148,29 +323,194 @@ def keyword(
                 item.name as name,
                 item.type as type,
                 item.description as description,
-                ({score_expr}) as score,
-                left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
+                ({" + ".join([_KEYWORD_TERM_SCORE] * KEYWORD_TERM_SLOTS)}) as score,
+                left(COALESCE(item.text, content_str), 500) as content
             FROM index_items
         ) scored
-        WHERE score > 0 {type_filter}
+        WHERE score > 0
+        AND {_TYPE_FILTER.format(column="type")}
+        AND {_EXCLUDE_FILTER.format(column="path")}
+        ORDER BY score DESC
+        LIMIT ?
+    """
+
+# Index and query embeddings are both unit length, so their inner product is
+# the cosine similarity without recomputing norms per row
+_SEMANTIC_SQL = f"""
+        SELECT
+            item.path as path,
+            item.name as name,
+            item.type as type,
+            item.description as description,
+            COALESCE(array_inner_product(embedding_vec, ?::FLOAT[{EMBEDDING_DIM}]), 0.0) as score,
+            left(content_str, 500) as content
+        FROM index_items
+        WHERE embedding_vec IS NOT NULL
+        ORDER BY score DESC
+        LIMIT ?
+    """
+
+# Keyword and semantic hits merged per path, keeping each path's best row
+_FIND_SQL = f"""
+        WITH kw AS ({_KEYWORD_SQL}),
+        sem AS ({_SEMANTIC_SQL}),
+        hits AS (
+            SELECT * FROM kw
+            UNION ALL
+            SELECT * FROM sem
+        )
+        SELECT
+            path,
+            arg_max(name, score) as name,
+            arg_max(type, score) as type,
+            arg_max(description, score) as description,
+            max(score) as score,
+            arg_max(content, score) as content
+        FROM hits
+        GROUP BY path
         ORDER BY score DESC
         LIMIT ?
     """
-    params.append(limit)
+
+# Numbered parameters: $1 pattern, $2 types, $3 limit. The pattern is bound
+# once and, being constant for the query, compiled once by DuckDB. Fields are
+# matched separately (not as one concatenated blob) so ^ and $ keep
+# anchoring to each field.
+_REGEX_SQL = """
+        SELECT
+            item.path as path,
+            item.name as name,
+            item.type as type,
+            item.description as description,
+            1.0 as score,
+            left(COALESCE(item.text, content_str), 500) as content
+        FROM index_items
+        WHERE (
+            regexp_matches(COALESCE(item.text, ''), $1)
+            OR regexp_matches(content_str, $1)
+            OR regexp_matches(item.name, $1)
+        )
+        AND (CAST($2 AS VARCHAR[]) IS NULL OR list_contains($2, item.type))
+        LIMIT $3
+    """
+
+# All items of one type; the no-query shape of find_by_type()
+_BY_TYPE_SQL = f"""
+        SELECT
+            item.path as path,
+            item.name as name,
+            item.type as type,
+            item.description as description,
+            1.0 as score,
+            left(content_str, 500) as content
+        FROM index_items
+        WHERE item.type = ?
+        AND {_EXCLUDE_FILTER.format(column="item.path")}
+        LIMIT ?
+    """
+
+# Numbered parameters: $1 type, $2 JSON path into content, $3 LIKE pattern,
+# $4 limit. The content field is selected by a bound path, so queries on
+# different fields share one statement.
+_STRUCTURED_SQL = """
+        SELECT
+            item.path as path,
+            item.name as name,
+            item.type as type,
+            item.description as description,
+            1.0 as score,
+            left(content_str, 500) as content
+        FROM index_items
+        WHERE (CAST($1 AS VARCHAR) IS NULL OR item.type = $1)
+        AND (
+            CAST($2 AS VARCHAR) IS NULL
+            OR json_extract_string(item.content, CAST($2 AS VARCHAR)) LIKE $3 ESCAPE '\\'
+        )
+        LIMIT $4
+    """
+
+_LIST_TYPES_SQL = """
+        SELECT item.type, count(*) as count
+        FROM index_items
+        GROUP BY item.type
+        ORDER BY count DESC
+    """
+
+
+# =============================================================================
+# CORE SEARCH METHODS
+# =============================================================================
+
+
+def _result_dicts(rows: list[tuple]) -> list[dict]:
+    """Convert rows of the shared search result shape into dicts.
+
+    Every search template selects path, name, type, description, score and
+    content in that order.
+    """
+    return [
+        {
+            "path": r[0],
+            "name": r[1],
+            "type": r[2],
+            "description": r[3],
+            "score": r[4],
+            "content": r[5],
+        }
+        for r in rows
+    ]
+
+
+def _keyword_params(
+    query: str,
+    types: Optional[list[str]],
+    limit: int,
+    exclude_paths: Optional[list[str]] = None,
+) -> list:
+    """Build the bound parameters for _KEYWORD_SQL."""
+    # Split query into terms
+    terms = [t.strip() for t in query.split() if len(t.strip()) >= 2]
+    if not terms:
+        terms = [query]
+
+    # Lowercase each pattern once here rather than per row in SQL; unused
+    # term slots get NULL, which never matches and scores 0
+    slots = [f"%{escape_like(term.lower())}%" for term in terms[:KEYWORD_TERM_SLOTS]]
+    slots += [None] * (KEYWORD_TERM_SLOTS - len(slots))
+    params = [pattern for pattern in slots for _ in range(5)]
+    params.extend([types or None, types or None])
+    params.extend([exclude_paths or None, exclude_paths or None, limit])
+    return params
+
+
+def keyword(
+    query: str,
+    types: Optional[list[str]] = None,
+    limit: int = 20,
+    exclude_paths: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Multi-term keyword search across all indexed content.
+
+    Searches: name, description, text, content, tags
+    Scores results by relevance (name matches score highest).
+
+    Args:
+        query: Search query (can be multi-word)
+        types: Optional list of types to filter by
+        limit: Maximum results
+        exclude_paths: Optional paths to leave out of the results
+
+    Returns:
+        List of dicts with: path, name, type, description, score, content
+    """
+    con = _get_connection()
 
     try:
-        results = con.execute(sql, params).fetchall()
-        return [
-            {
-                "path": r[0],
-                "name": r[1],
-                "type": r[2],
-                "description": r[3],
-                "score": r[4],
-                "content": r[5],
-            }
-            for r in results
-        ]
+        results = con.execute(
+            _KEYWORD_SQL, _keyword_params(query, types, limit, exclude_paths)
+        ).fetchall()
+        return _result_dicts(results)
     except Exception as e:
         print(f"Keyword search error: {e}")
         return []
@@ -190,43 +530,15 @@ def semantic(query: str, limit: int = 10) -> list[dict]:
     Returns:
         List of dicts with: path, name, type, description, score, content
     """
-    if not INDEX_PATH.exists():
-        _ensure_index()
-
-    query_embedding = embed(query)
+    query_embedding = _embed_query(query)
     if not query_embedding:
         return keyword(query, limit=limit)
 
     con = _get_connection()
 
-    sql = """
-        SELECT
-            item.path as path,
-            item.name as name,
-            item.type as type,
-            item.description as description,
-            list_cosine_similarity(item.embedding, ?) as score,
-            left(CAST(item.content AS VARCHAR), 500) as content
-        FROM index_items
-        WHERE item.embedding IS NOT NULL
-        AND len(item.embedding) > 0
-        ORDER BY score DESC
-        LIMIT ?
-    """
-
     try:
-        results = con.execute(sql, [query_embedding, limit]).fetchall()
-        return [
-            {
-                "path": r[0],
-                "name": r[1],
-                "type": r[2],
-                "description": r[3],
-                "score": r[4] or 0.0,
-                "content": r[5],
-            }
-            for r in results
-        ]
+        results = con.execute(_SEMANTIC_SQL, [query_embedding, limit]).fetchall()
+        return _result_dicts(results)
     except Exception as e:
         print(f"Semantic search error: {e}")
         return keyword(query, limit=limit)
@@ -248,47 +560,11 @@ def regex(
     Returns:
         List of dicts with: path, name, type, description, score, content
     """
-    if not INDEX_PATH.exists():
-        _ensure_index()
-
     con = _get_connection()
 
-    type_filter = ""
-    if types:
-        type_list = ", ".join(f"'{t}'" for t in types)
-        type_filter = f"AND item.type IN ({type_list})"
-
-    sql = f"""
-        SELECT
-            item.path as path,
-            item.name as name,
-            item.type as type,
-            item.description as description,
-            1.0 as score,
-            left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
-        FROM index_items
-        WHERE (
-            regexp_matches(COALESCE(item.text, ''), ?)
-            OR regexp_matches(CAST(item.content AS VARCHAR), ?)
-            OR regexp_matches(item.name, ?)
-        )
-        {type_filter}
-        LIMIT ?
-    """
-
     try:
-        results = con.execute(sql, [pattern, pattern, pattern, limit]).fetchall()
-        return [
-            {
-                "path": r[0],
-                "name": r[1],
-                "type": r[2],
-                "description": r[3],
-                "score": r[4],
-                "content": r[5],
-            }
-            for r in results
-        ]
+        results = con.execute(_REGEX_SQL, [pattern, types or None, limit]).fetchall()
+        return _result_dicts(results)
     except Exception as e:
         print(f"Regex search error: {e}")
         return []
@@ -299,7 +575,9 @@ def sql(query_str: str, params: Optional[dict] = None) -> list[dict]:
     Execute raw SQL query against the index.
 
     For advanced queries that need full DuckDB power.
-    The index is available as 'index_items' view with 'item' column.
+    The index is available as 'index_items' with an 'item' column
+    (plus content_str, the serialized content, and lowercased *_lc copies
+    of the keyword-searched fields).
 
     Args:
         query_str: SQL query string (use $param_name for parameters)
@@ -308,9 +586,6 @@ def sql(query_str: str, params: Optional[dict] = None) -> list[dict]:
     Returns:
         List of result dicts
     """
-    if not INDEX_PATH.exists():
-        _ensure_index()
-
     params = params or {}
     con = _get_connection()
 
@@ -342,52 +617,19 @@ def structured(
     Returns:
         List of dicts with: path, name, type, description, score, content
     """
-    if not INDEX_PATH.exists():
-        _ensure_index()
-
     con = _get_connection()
 
-    conditions = []
-    params = []
-
-    if item_type:
-        conditions.append("item.type = ?")
-        params.append(item_type)
-
+    # Unset filters are bound as NULL, which disables them
+    path = pattern = None
     if field and value:
-        # Query nested JSON field
-        conditions.append(f"CAST(item.content->>'{field}' AS VARCHAR) LIKE ?")
-        params.append(f"%{value}%")
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    sql_query = f"""
-        SELECT
-            item.path as path,
-            item.name as name,
-            item.type as type,
-            item.description as description,
-            1.0 as score,
-            left(CAST(item.content AS VARCHAR), 500) as content
-        FROM index_items
-        WHERE {where_clause}
-        LIMIT ?
-    """
-    params.append(limit)
+        path = json_path(field)
+        pattern = f"%{escape_like(value)}%"
 
     try:
-        results = con.execute(sql_query, params).fetchall()
-        return [
-            {
-                "path": r[0],
-                "name": r[1],
-                "type": r[2],
-                "description": r[3],
-                "score": r[4],
-                "content": r[5],
-            }
-            for r in results
-        ]
+        results = con.execute(
+            _STRUCTURED_SQL, [item_type or None, path, pattern, limit]
+        ).fetchall()
+        return _result_dicts(results)
     except Exception as e:
         print(f"Structured query error: {e}")
         return []
@@ -402,7 +644,8 @@ def find(query: str, limit: int = 10) -> list[dict]:
     """
     Smart search: combines keyword and semantic search, merges and dedupes results.
 
-    This is the go-to function for general searching.
+    This is the go-to function for general searching. Both searches and the
+    merge run as a single query; each path keeps its highest-scoring hit.
 
     Args:
         query: Search query
@@ -411,22 +654,20 @@ def find(query: str, limit: int = 10) -> list[dict]:
     Returns:
         Merged list of search results
     """
-    # Run both searches
-    kw_results = keyword(query, limit=limit)
-    sem_results = semantic(query, limit=limit)
-
-    # Merge and dedupe by path
-    seen = set()
-    merged = []
+    # Without a query embedding semantic() is just keyword() again
+    query_embedding = _embed_query(query)
+    if not query_embedding:
+        return keyword(query, limit=limit)
 
-    for r in kw_results + sem_results:
-        if r["path"] not in seen:
-            seen.add(r["path"])
-            merged.append(r)
+    con = _get_connection()
+    params = _keyword_params(query, None, limit) + [query_embedding, limit, limit]
 
-    # Sort by score and return top results
-    merged.sort(key=lambda x: x.get("score", 0), reverse=True)
-    return merged[:limit]
+    try:
+        results = con.execute(_FIND_SQL, params).fetchall()
+        return _result_dicts(results)
+    except Exception as e:
+        print(f"Find error: {e}")
+        return keyword(query, limit=limit)
 
 
 def find_code(pattern: str, limit: int = 30) -> list[dict]:
@@ -445,7 +686,12 @@ def find_code(pattern: str, limit: int = 30) -> list[dict]:
     return regex(pattern, types=["code", "tool", "lib"], limit=limit)
 
 
-def find_by_type(item_type: str, query: Optional[str] = None, limit: int = 50) -> list[dict]:
+def find_by_type(
+    item_type: str,
+    query: Optional[str] = None,
+    limit: int = 50,
+    exclude_paths: Optional[list[str]] = None,
+) -> list[dict]:
     """
     Find all items of a specific type, optionally filtered by query.
 
@@ -453,13 +699,23 @@ def find_by_type(item_type: str, query: Optional[str] = None, limit: int = 50) -
         item_type: Type to search (agent, rule, tool, code, etc.)
         query: Optional keyword to filter within type
         limit: Maximum results
+        exclude_paths: Optional paths to leave out of the results
 
     Returns:
         List of matching items
     """
     if query:
-        return keyword(query, types=[item_type], limit=limit)
-    return structured(item_type=item_type, limit=limit)
+        return keyword(query, types=[item_type], limit=limit, exclude_paths=exclude_paths)
+
+    con = _get_connection()
+    params = [item_type, exclude_paths or None, exclude_paths or None, limit]
+
+    try:
+        results = con.execute(_BY_TYPE_SQL, params).fetchall()
+        return _result_dicts(results)
+    except Exception as e:
+        print(f"Structured query error: {e}")
+        return []
 
 
 def find_related(path: str, limit: int = 5) -> list[dict]:
@@ -511,28 +767,34 @@ def context_for(task: str) -> str:
             lines.append(f"- **{r['name']}** ({r['type']}): {r['description'][:100]}")
             lines.append(f"  Path: {r['path']}")
         lines.append("")
-
-    # Semantic search
-    sem = semantic(task, limit=5)
+    seen_paths = [r["path"] for r in kw]
+
+    # Semantic search, skipped when keyword matches are already strong
+    saturated = (
+        len(kw) >= CONTEXT_SATURATION_COUNT
+        and kw[0]["score"] >= CONTEXT_SATURATION_SCORE
+    )
+    sem = [] if saturated else semantic(task, limit=5)
     if sem:
         lines.append("## Semantically Related")
         for r in sem:
-            if r["path"] not in [x["path"] for x in kw]:  # Dedupe
+            if r["path"] not in seen_paths:  # Dedupe
                 lines.append(f"- **{r['name']}** ({r['type']}): {r['description'][:100]}")
                 lines.append(f"  Path: {r['path']}")
+                seen_paths.append(r["path"])
         lines.append("")
 
-    # Relevant rules
-    rules = find_by_type("rule", task, limit=3)
+    # Relevant rules not already listed
+    rules = find_by_type("rule", task, limit=3, exclude_paths=seen_paths)
     if rules:
         lines.append("## Relevant Rules")
         for r in rules:
             lines.append(f"- **{r['name']}**: {r['description'][:100]}")
         lines.append("")
 
-    # Related decisions/lessons
-    decisions = find_by_type("decision", task, limit=2)
-    lessons = find_by_type("lesson", task, limit=2)
+    # Related decisions/lessons not already listed
+    decisions = find_by_type("decision", task, limit=2, exclude_paths=seen_paths)
+    lessons = find_by_type("lesson", task, limit=2, exclude_paths=seen_paths)
     if decisions or lessons:
         lines.append("## Knowledge Base")
         for r in decisions + lessons:
@@ -558,36 +820,36 @@ def search_everything(query: str, limit: int = 20) -> dict:
     Returns:
         Dict with results from each search method
     """
-    return {
-        "keyword": keyword(query, limit=limit),
-        "semantic": semantic(query, limit=limit),
-        "regex": regex(query, limit=limit) if len(query) >= 2 else [],
-        "agents": find_by_type("agent", query, limit=10),
-        "rules": find_by_type("rule", query, limit=10),
-        "tools": find_by_type("tool", query, limit=10),
-        "code": find_by_type("code", query, limit=10),
-        "decisions": find_by_type("decision", query, limit=5),
-        "lessons": find_by_type("lesson", query, limit=5),
-        "research": find_by_type("deep_research", query, limit=5),
+    searches = {
+        "keyword": lambda: keyword(query, limit=limit),
+        "semantic": lambda: semantic(query, limit=limit),
+        "regex": lambda: regex(query, limit=limit) if len(query) >= 2 else [],
+        "agents": lambda: find_by_type("agent", query, limit=10),
+        "rules": lambda: find_by_type("rule", query, limit=10),
+        "tools": lambda: find_by_type("tool", query, limit=10),
+        "code": lambda: find_by_type("code", query, limit=10),
+        "decisions": lambda: find_by_type("decision", query, limit=5),
+        "lessons": lambda: find_by_type("lesson", query, limit=5),
+        "research": lambda: find_by_type("deep_research", query, limit=5),
     }
 
+    # Build/load the index once up front so the workers don't race to do it
+    _get_connection()
+
+    # DuckDB releases the GIL while executing, and each search runs on its
+    # own cursor, so the searches can run concurrently
+    workers = min(len(searches), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(search) for name, search in searches.items()}
+        return {name: future.result() for name, future in futures.items()}
+
 
 def list_types() -> dict[str, int]:
     """List all indexed types and their counts."""
-    if not INDEX_PATH.exists():
-        _ensure_index()
-
     con = _get_connection()
 
-    sql_query = """
-        SELECT item.type, count(*) as count
-        FROM index_items
-        GROUP BY item.type
-        ORDER BY count DESC
-    """
-
     try:
-        results = con.execute(sql_query).fetchall()
+        results = con.execute(_LIST_TYPES_SQL).fetchall()
         return {r[0]: r[1] for r in results}
     except Exception as e:
         print(f"Error listing types: {e}")
@@ -17,19 +17,22 @@ Usage:
     # Generate resume prompt for a session
     uv run python -m lib.resume <session-id>
 
-    # Copy to clipboard (macOS)
+    # Copy to clipboard (pbcopy, wl-copy or xclip)
     uv run python -m lib.resume <session-id> --clipboard
 
     # Resume with full context
     uv run python -m lib.resume <session-id> --full
 """
 
-import json
-import subprocess
+import os
+import re
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 def _utcnow() -> datetime:
@@ -39,12 +42,77 @@ def _utcnow() -> datetime:
 from pilot_core.session import (
     Session,
     load_session,
+    find_sessions_by_prefix,
     find_stuck_sessions,
     get_recent_sessions,
     list_project_sessions,
     ToolCall,
 )
 
+# Characters past max_length that _truncate_middle() lets through uncut
+TRUNCATE_SLACK = 128
+
+# Checkbox marker per todo status; any other status is shown as ">"
+TODO_MARKERS = {"completed": "x", "pending": " "}
+
+# Whitespace flattened to spaces in one-line prompt and task previews
+PREVIEW_TRANSLATION = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# ANSI colors for session statuses in --list output
+STATUS_COLORS = {
+    "stuck": "\033[93m",      # Yellow
+    "error": "\033[91m",      # Red
+    "abandoned": "\033[90m",  # Gray
+    "completed": "\033[92m",  # Green
+    "in_progress": "\033[94m", # Blue
+}
+
+# A complete session ID, which can be loaded without listing the project
+SESSION_ID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+# Clipboard commands in order of preference (macOS, Wayland, X11)
+CLIPBOARD_COMMANDS = [
+    ("pbcopy",),
+    ("wl-copy",),
+    ("xclip", "-selection", "clipboard"),
+]
+
+
+# Clipboard support is resolved on first copy and cached, so commands that
+# never copy (--list, --json) don't pay for AppKit or PATH lookups at startup
+@lru_cache(maxsize=1)
+def _pasteboard():
+    """Return the macOS general pasteboard via pyobjc, or None if unavailable."""
+    try:
+        from AppKit import NSPasteboard
+    except ImportError:
+        return None
+    return NSPasteboard.generalPasteboard()
+
+
+@lru_cache(maxsize=1)
+def _clipboard_cmd() -> Optional[tuple[str, ...]]:
+    """Return the first installed clipboard command, or None."""
+    import shutil
+
+    for cmd in CLIPBOARD_COMMANDS:
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+def _first_unique(items: Iterable[str], limit: int) -> list[str]:
+    """Return the first `limit` distinct items, in order of first appearance."""
+    seen = set()
+    unique = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            unique.append(item)
+            if len(unique) == limit:
+                break
+    return unique
+
 
 def _summarize_tool_calls(tool_calls: list[ToolCall], max_items: int = 20) -> str:
     """Summarize tool calls into a readable format."""
@@ -52,27 +120,25 @@ def _summarize_tool_calls(tool_calls: list[ToolCall], max_items: int = 20) -> st
         return "  (none)"
 
     # Group by tool type
-    by_tool = {}
+    by_tool = defaultdict(list)
     for tc in tool_calls:
-        if tc.name not in by_tool:
-            by_tool[tc.name] = []
         by_tool[tc.name].append(tc)
 
     lines = []
     for tool_name, calls in sorted(by_tool.items()):
+        # Paths are read lazily, so only the calls up to the fifth distinct
+        # file are inspected rather than every call of the type
         if tool_name == "Read":
-            files = [c.input.get("file_path", "?") for c in calls]
-            unique_files = list(set(files))[:5]
-            lines.append(f"  - Read: {len(files)} files ({', '.join(Path(f).name for f in unique_files)}{'...' if len(unique_files) < len(files) else ''})")
+            unique_files = _first_unique((c.input.get("file_path", "?") for c in calls), 5)
+            lines.append(f"  - Read: {len(calls)} files ({', '.join(os.path.basename(f) for f in unique_files)}{'...' if len(unique_files) < len(calls) else ''})")
 
         elif tool_name == "Write":
             files = [c.input.get("file_path", "?") for c in calls]
-            lines.append(f"  - Write: {', '.join(Path(f).name for f in files)}")
+            lines.append(f"  - Write: {', '.join(os.path.basename(f) for f in files)}")
 
         elif tool_name == "Edit":
-            files = [c.input.get("file_path", "?") for c in calls]
-            unique_files = list(set(files))[:5]
-            lines.append(f"  - Edit: {len(calls)} edits to {', '.join(Path(f).name for f in unique_files)}")
+            unique_files = _first_unique((c.input.get("file_path", "?") for c in calls), 5)
+            lines.append(f"  - Edit: {len(calls)} edits to {', '.join(os.path.basename(f) for f in unique_files)}")
 
         elif tool_name == "Bash":
             cmds = [c.input.get("command", "")[:50] for c in calls[:5]]
@@ -81,8 +147,8 @@ def _summarize_tool_calls(tool_calls: list[ToolCall], max_items: int = 20) -> st
                 lines.append(f"      {cmd}...")
 
         elif tool_name == "Task":
-            descriptions = [c.input.get("description", "?") for c in calls]
-            lines.append(f"  - Task (subagents): {', '.join(descriptions[:3])}")
+            descriptions = [c.input.get("description", "?") for c in calls[:3]]
+            lines.append(f"  - Task (subagents): {', '.join(descriptions)}")
 
         elif tool_name in ("Grep", "Glob"):
             lines.append(f"  - {tool_name}: {len(calls)} searches")
@@ -98,23 +164,23 @@ def _format_todos(todos: list[dict]) -> str:
     if not todos:
         return "  (none)"
 
-    lines = []
-    for t in todos:
-        status = t.get("status", "?")
-        content = t.get("content", "?")
-        marker = "x" if status == "completed" else " " if status == "pending" else ">"
-        lines.append(f"  [{marker}] {content}")
-
-    return "\n".join(lines)
+    return "\n".join([
+        f"  [{TODO_MARKERS.get(t.get('status'), '>')}] {t.get('content', '?')}"
+        for t in todos
+    ])
 
 
 def _truncate_middle(text: str, max_length: int = 2000) -> str:
-    """Truncate text in the middle if too long."""
-    if len(text) <= max_length:
+    """Truncate text in the middle if too long.
+
+    Text up to TRUNCATE_SLACK characters over max_length is returned as is:
+    cutting it would drop only a few lines while copying the whole text.
+    """
+    if len(text) <= max_length + TRUNCATE_SLACK:
         return text
 
     half = max_length // 2 - 20
-    return text[:half] + "\n\n... [truncated] ...\n\n" + text[-half:]
+    return f"{text[:half]}\n\n... [truncated] ...\n\n{text[-half:]}"
 
 
 def generate_resume_prompt(
@@ -133,113 +199,119 @@ def generate_resume_prompt(
     Returns:
         A prompt string that can be used to resume the session
     """
-    lines = []
-
-    # Header
-    lines.append("# RESUME SESSION")
-    lines.append("")
-    lines.append("This is a CONTINUATION of a previous Claude Code session that was interrupted.")
-    lines.append("Please review the context below and continue where it left off.")
-    lines.append("")
-
-    # Session metadata
-    lines.append("## Session Info")
-    lines.append(f"- **Session ID**: `{session.session_id}`")
-    lines.append(f"- **Project**: `{session.project_path}`")
-    lines.append(f"- **Started**: {session.started_at.strftime('%Y-%m-%d %H:%M')}")
-    lines.append(f"- **Last Activity**: {session.last_activity.strftime('%Y-%m-%d %H:%M')}")
-    lines.append(f"- **Status**: {session.status}")
-    lines.append(f"- **Duration**: {session.duration_minutes:.1f} minutes")
-    lines.append("")
-
-    # Original task
-    lines.append("## Original Task")
-    lines.append("```")
-    lines.append(_truncate_middle(session.initial_prompt, 2000))
-    lines.append("```")
-    lines.append("")
-
-    # Work completed
-    lines.append("## Work Completed")
-    lines.append("")
-    lines.append("### Tool Usage Summary")
-    lines.append(_summarize_tool_calls(session.tool_calls))
-    lines.append("")
+    # Session timestamps are naive UTC (see session._parse_timestamp), so
+    # isoformat() renders exactly like strftime('%Y-%m-%d %H:%M').
+    #
+    # Each section is one block of lines; blocks are joined once at the end.
+    # Sections ending in a blank line end in "\n" here.
+    files_written = session.files_written
+    last_error = session.last_error
+    sections = [f"""# RESUME SESSION
+
+This is a CONTINUATION of a previous Claude Code session that was interrupted.
+Please review the context below and continue where it left off.
+
+## Session Info
+- **Session ID**: `{session.session_id}`
+- **Project**: `{session.project_path}`
+- **Started**: {session.started_at.isoformat(' ', 'minutes')}
+- **Last Activity**: {session.last_activity.isoformat(' ', 'minutes')}
+- **Status**: {session.status}
+- **Duration**: {session.duration_minutes:.1f} minutes
+
+## Original Task
+```
+{_truncate_middle(session.initial_prompt, 2000)}
+```
+
+## Work Completed
+
+### Tool Usage Summary
+{_summarize_tool_calls(session.tool_calls)}
+"""]
 
     # Files modified
-    if session.files_written:
-        lines.append("### Files Created/Modified")
-        for f in session.files_written[:20]:
-            lines.append(f"  - `{f}`")
-        if len(session.files_written) > 20:
-            lines.append(f"  - ... and {len(session.files_written) - 20} more")
-        lines.append("")
+    if files_written:
+        files = "".join(f"  - `{f}`\n" for f in files_written[:20])
+        if len(files_written) > 20:
+            files += f"  - ... and {len(files_written) - 20} more\n"
+        sections.append(f"### Files Created/Modified\n{files}")
 
     # Bash commands
     recent_commands = session.bash_commands[-5:]
     if recent_commands:
-        lines.append("### Recent Commands")
-        for cmd in recent_commands:
-            lines.append(f"  - `{cmd[:80]}{'...' if len(cmd) > 80 else ''}`")
-        lines.append("")
+        commands = "".join(
+            f"  - `{cmd[:80]}{'...' if len(cmd) > 80 else ''}`\n" for cmd in recent_commands
+        )
+        sections.append(f"### Recent Commands\n{commands}")
 
     # Current state (todos)
-    lines.append("## Current State")
-    lines.append("")
-    lines.append("### Todo List")
-    lines.append(_format_todos(session.todos))
-    lines.append("")
+    sections.append(f"""## Current State
+
+### Todo List
+{_format_todos(session.todos)}
+""")
 
     # Error info
-    if session.last_error:
-        lines.append("## Last Error")
-        lines.append("```")
-        lines.append(_truncate_middle(session.last_error, 1000))
-        lines.append("```")
-        lines.append("")
+    if last_error:
+        sections.append(f"""## Last Error
+```
+{_truncate_middle(last_error, 1000)}
+```
+""")
 
     # Message history (condensed)
     if include_full_messages:
-        lines.append("## Message History")
-        lines.append("")
-        for i, msg in enumerate(session.messages[-10:]):  # Last 10 messages
+        history = ["## Message History\n"]
+        # Messages that fit are used as is, without a _truncate_middle() call
+        fits_length = max_message_length + TRUNCATE_SLACK
+        for msg in session.messages[-10:]:  # Last 10 messages
             role_marker = "USER" if msg.role == "user" else "ASSISTANT"
-            lines.append(f"### [{role_marker}] ({msg.timestamp.strftime('%H:%M')})")
-            content = _truncate_middle(msg.content, max_message_length)
-            lines.append(content)
+            content = msg.content
+            if len(content) > fits_length:
+                content = _truncate_middle(content, max_message_length)
+            # Formatted directly: strftime is ~3x slower per message
+            ts = msg.timestamp
+            entry = (
+                f"### [{role_marker}] ({ts.hour:02d}:{ts.minute:02d})\n"
+                f"{content}\n"
+            )
             if msg.tool_calls:
-                lines.append(f"  *Tools used: {', '.join(tc.name for tc in msg.tool_calls)}*")
-            lines.append("")
+                entry += f"  *Tools used: {', '.join(tc.name for tc in msg.tool_calls)}*\n"
+            history.append(entry)
+        sections.append("\n".join(history))
 
     # Instructions for continuation
-    lines.append("## Instructions")
-    lines.append("")
-    lines.append("Please continue this session:")
-    lines.append("")
-
     if session.pending_todos:
-        lines.append("1. **Complete pending todos** - The todo list above shows remaining work")
+        first_step = "1. **Complete pending todos** - The todo list above shows remaining work"
     else:
-        lines.append("1. **Review the original task** - Determine if it was fully completed")
+        first_step = "1. **Review the original task** - Determine if it was fully completed"
 
-    if session.last_error:
-        lines.append("2. **Investigate the error** - The session stopped due to an error")
+    if last_error:
+        second_step = "2. **Investigate the error** - The session stopped due to an error"
     else:
-        lines.append("2. **Continue from where work stopped** - Resume the last action")
+        second_step = "2. **Continue from where work stopped** - Resume the last action"
+
+    sections.append(f"""## Instructions
 
-    lines.append("3. **Update the todo list** - Mark completed items and add new ones as needed")
-    lines.append("4. **Verify completion** - Ensure the original task is fully addressed")
-    lines.append("")
+Please continue this session:
+
+{first_step}
+{second_step}
+3. **Update the todo list** - Mark completed items and add new ones as needed
+4. **Verify completion** - Ensure the original task is fully addressed
+""")
 
     # Helpful context
-    if session.files_written:
-        lines.append("### Key Files to Review")
-        lines.append("These files were modified in the previous session and may need review:")
-        for f in session.files_written[:5]:
-            lines.append(f"  - `{f}`")
-        lines.append("")
+    if files_written:
+        key_files = "".join(f"  - `{f}`\n" for f in files_written[:5])
+        sections.append(
+            "### Key Files to Review\n"
+            "These files were modified in the previous session and may need review:\n"
+            f"{key_files}"
+        )
 
-    return "\n".join(lines)
+    return "\n".join(sections)
 
 
 def generate_minimal_resume(session: Session) -> str:
@@ -247,7 +319,8 @@ def generate_minimal_resume(session: Session) -> str:
     pending = [t.get("content", "?") for t in session.pending_todos]
     pending_str = ", ".join(pending[:3]) if pending else "none"
 
-    files_str = ", ".join(Path(f).name for f in session.files_written[:3]) if session.files_written else "none"
+    files_written = session.files_written
+    files_str = ", ".join(os.path.basename(f) for f in files_written[:3]) if files_written else "none"
 
     error_str = f" Last error: {session.last_error[:100]}..." if session.last_error else ""
 
@@ -270,15 +343,32 @@ Please review and continue where the previous session left off. Check the todo l
 
 
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to clipboard (macOS only)."""
+    """Copy text to clipboard (pbcopy on macOS, wl-copy or xclip on Linux)."""
+    pasteboard = _pasteboard()
+    if pasteboard is not None:
+        try:
+            from AppKit import NSPasteboardTypeString
+
+            pasteboard.clearContents()
+            if pasteboard.setString_forType_(text, NSPasteboardTypeString):
+                return True
+        except Exception:
+            pass
+
+    cmd = _clipboard_cmd()
+    if cmd is None:
+        return False
     try:
-        process = subprocess.Popen(
-            ["pbcopy"],
-            stdin=subprocess.PIPE,
-            env={"LANG": "en_US.UTF-8"},
+        import subprocess
+
+        result = subprocess.run(
+            cmd,
+            input=text,
+            encoding="utf-8",
+            env={**os.environ, "LANG": "en_US.UTF-8"},
+            check=False,
         )
-        process.communicate(text.encode("utf-8"))
-        return process.returncode == 0
+        return result.returncode == 0
     except Exception:
         return False
 
@@ -303,24 +393,25 @@ def check_for_stuck_sessions(
     project = project_path or str(Path.cwd())
     stuck = find_stuck_sessions(project)
 
-    # Filter by age
+    # Filter by age and summarize in one pass, stopping at the 5 most recent
     cutoff = _utcnow() - timedelta(hours=max_age_hours)
-    recent_stuck = [s for s in stuck if s.last_activity > cutoff]
-
-    # Return summary info for each
-    return [
-        {
-            "session_id": s.session_id,
-            "short_id": s.session_id[:8],
-            "status": s.status,
-            "task": s.initial_prompt[:100],
-            "pending_todos": len(s.pending_todos),
-            "last_activity": s.last_activity.isoformat(),
-            "has_error": s.last_error is not None,
-            "files_modified": len(s.files_written),
-        }
-        for s in recent_stuck[:5]  # Limit to 5 most recent
-    ]
+    return list(islice(
+        (
+            {
+                "session_id": s.session_id,
+                "short_id": s.session_id[:8],
+                "status": s.status,
+                "task": s.initial_prompt[:100],
+                "pending_todos": len(s.pending_todos),
+                "last_activity": s.last_activity.isoformat(),
+                "has_error": s.last_error is not None,
+                "files_modified": len(s.files_written),
+            }
+            for s in stuck
+            if s.last_activity > cutoff
+        ),
+        5,
+    ))
 
 
 def format_stuck_sessions_alert(sessions: list[dict]) -> str:
@@ -345,7 +436,7 @@ def format_stuck_sessions_alert(sessions: list[dict]) -> str:
 
     for s in sessions:
         status_emoji = "!" if s["has_error"] else "?"
-        task_preview = s["task"][:60].replace("\n", " ")
+        task_preview = s["task"][:60].translate(PREVIEW_TRANSLATION)
         lines.append(f"  [{status_emoji}] `{s['short_id']}` - {task_preview}...")
         if s["pending_todos"] > 0:
             lines.append(f"      {s['pending_todos']} pending todos")
@@ -393,7 +484,7 @@ Examples:
     parser.add_argument("--project", "-p", help="Project path (default: current directory)")
     parser.add_argument("--list", "-l", action="store_true", help="List stuck/recent sessions")
     parser.add_argument("--all", "-a", action="store_true", help="List all sessions (not just stuck)")
-    parser.add_argument("--clipboard", "-c", action="store_true", help="Copy to clipboard (macOS)")
+    parser.add_argument("--clipboard", "-c", action="store_true", help="Copy to clipboard (pbcopy, wl-copy or xclip)")
     parser.add_argument("--full", "-f", action="store_true", help="Include full message history")
     parser.add_argument("--minimal", "-m", action="store_true", help="Generate minimal one-paragraph resume")
     parser.add_argument("--json", "-j", action="store_true", help="Output session data as JSON")
@@ -424,77 +515,86 @@ Examples:
             print(f"       Current path: {project}")
             return
 
+        now = _utcnow()
+        lines = []
         for s in sessions:
-            age_mins = (_utcnow() - s.last_activity).total_seconds() / 60
-            if age_mins < 60:
-                age_str = f"{int(age_mins)}m"
-            elif age_mins < 1440:
-                age_str = f"{int(age_mins/60)}h"
+            age_secs = (now - s.last_activity).total_seconds()
+            if age_secs < 3600:
+                age_str = f"{int(age_secs / 60)}m"
+            elif age_secs < 86400:
+                age_str = f"{int(age_secs / 3600)}h"
             else:
-                age_str = f"{int(age_mins/1440)}d"
-
-            status_colors = {
-                "stuck": "\033[93m",      # Yellow
-                "error": "\033[91m",      # Red
-                "abandoned": "\033[90m",  # Gray
-                "completed": "\033[92m",  # Green
-                "in_progress": "\033[94m", # Blue
-            }
-            color = status_colors.get(s.status, "")
+                age_str = f"{int(age_secs / 86400)}d"
+
+            color = STATUS_COLORS.get(s.status, "")
             reset = "\033[0m" if color else ""
 
-            prompt_preview = s.initial_prompt[:50].replace("\n", " ")
-            print(f"  {s.session_id[:8]}  {color}[{s.status:10}]{reset}  {age_str:>4} ago  {prompt_preview}...")
+            prompt_preview = s.initial_prompt[:50].translate(PREVIEW_TRANSLATION)
+            lines.append(f"  {s.session_id[:8]}  {color}[{s.status:10}]{reset}  {age_str:>4} ago  {prompt_preview}...")
 
-        print(f"\nTo resume a session:")
-        print(f"  uv run python -m lib.resume <session-id> --clipboard")
-        print(f"  uv run python -m lib.resume <session-id> | pbcopy")
+        lines.append("\nTo resume a session:")
+        lines.append("  uv run python -m lib.resume <session-id> --clipboard")
+        lines.append("  uv run python -m lib.resume <session-id> | pbcopy")
+        # One write for the whole listing rather than one per session
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # Generate resume prompt for a specific session
     session_id = args.session_id
 
-    # Find matching session
-    session_ids = list_project_sessions(project)
-    matching = [sid for sid in session_ids if sid.startswith(session_id)]
+    # A full session ID is loaded directly; anything else is a prefix
+    session = None
+    if SESSION_ID_RE.match(session_id):
+        session = load_session(project, session_id)
+
+    if session is None:
+        matching = find_sessions_by_prefix(project, session_id)
 
-    if not matching:
-        print(f"No session found matching: {session_id}")
-        print(f"Project: {project}")
-        print(f"\nAvailable sessions:")
-        for sid in session_ids[:10]:
-            print(f"  {sid[:8]}")
-        sys.exit(1)
+        if not matching:
+            print(f"No session found matching: {session_id}")
+            print(f"Project: {project}")
+            print(f"\nAvailable sessions:")
+            for sid in list_project_sessions(project)[:10]:
+                print(f"  {sid[:8]}")
+            sys.exit(1)
 
-    if len(matching) > 1:
-        print(f"Multiple sessions match '{session_id}':")
-        for sid in matching[:10]:
-            print(f"  {sid}")
-        print("\nPlease provide a more specific session ID.")
-        sys.exit(1)
+        if len(matching) > 1:
+            print(f"Multiple sessions match '{session_id}':")
+            for sid in matching[:10]:
+                print(f"  {sid}")
+            print("\nPlease provide a more specific session ID.")
+            sys.exit(1)
 
-    full_session_id = matching[0]
-    session = load_session(project, full_session_id)
+        full_session_id = matching[0]
+        session = load_session(project, full_session_id)
 
-    if not session:
-        print(f"Failed to load session: {full_session_id}")
-        sys.exit(1)
+        if not session:
+            print(f"Failed to load session: {full_session_id}")
+            sys.exit(1)
 
     # Output
     if args.json:
+        # Datetimes are serialized by the encoder, in isoformat() form
         data = {
             "session_id": session.session_id,
             "project_path": session.project_path,
             "status": session.status,
-            "started_at": session.started_at.isoformat(),
-            "last_activity": session.last_activity.isoformat(),
+            "started_at": session.started_at,
+            "last_activity": session.last_activity,
             "initial_prompt": session.initial_prompt,
             "tool_call_count": len(session.tool_calls),
             "files_written": session.files_written,
             "pending_todos": session.pending_todos,
             "last_error": session.last_error,
         }
-        print(json.dumps(data, indent=2))
+        try:
+            import orjson
+
+            print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        except ImportError:
+            import json
+
+            print(json.dumps(data, indent=2, ensure_ascii=False, default=datetime.isoformat))
 
     elif args.minimal:
         prompt = generate_minimal_resume(session)
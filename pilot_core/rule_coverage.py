@@ -22,8 +22,12 @@ CLI:
 
 import json
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -78,6 +82,84 @@ ENFORCEMENT_PATTERNS = {
     },
 }
 
+# Keywords (regexes) that mark a line as enforcement code
+ENFORCEMENT_KEYWORDS = [
+    "BLOCKED", "DENIED", "PROHIBITED", "BANNED",
+    "MUST", "REQUIRED", "ENFORCE", "VALIDATE",
+    "ERROR.*not allowed", "reject", "refuse",
+]
+_ENFORCEMENT_LINE_RE = re.compile("|".join(ENFORCEMENT_KEYWORDS), re.IGNORECASE)
+# An identifier-like token (snake_case, kebab-case, camelCase, or a slash-
+# or dot-separated path such as lib/validate or yaml.safe_load), which
+# separates comments about enforcement code from keyword-only prose
+_IDENTIFIER_RE = re.compile(
+    r"[A-Za-z0-9]_[A-Za-z0-9]|_[A-Za-z]|[A-Za-z0-9]-[A-Za-z]|[a-z][A-Z]"
+    r"|[A-Za-z0-9_]/[A-Za-z_]|[A-Za-z0-9_]\.[A-Za-z_]"
+)
+
+# Keyword -> rule suggested for an orphaned enforcement line, first hit wins
+SUGGESTED_RULES = {
+    "review": "git-review-required",
+    "import": "web-access-policy",
+    "yaml": "agent-yaml-format",
+    "commit": "git-checkpoint",
+    "file": "naming-conventions",
+}
+# One lookahead per keyword, tried in table order, so lastgroup names the
+# first keyword present anywhere in the line rather than the leftmost one
+_SUGGEST_RE = re.compile(
+    "|".join(f"(?=.*(?P<{kw}>{re.escape(kw)}))" for kw in SUGGESTED_RULES),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Code patterns expected in a rule's enforcement files
+EXPECTED_PATTERNS = {
+    "git-review-required": [r"REVIEW_APPROVED", r"review.*marker"],
+    "web-access-policy": [r"requests|httpx", r"BANNED|blocked"],
+    "agent-yaml-format": [r"yaml\.safe_load", r"\.yaml"],
+    "code-enforcement-principle": [r"enforcement", r"code.*enforc"],
+}
+
+
+def _combine_patterns(patterns: list[str]) -> re.Pattern:
+    """Fuse patterns into one alternation whose group p<i> is patterns[i]."""
+    return re.compile(
+        "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns)), re.IGNORECASE
+    )
+
+
+# Expected patterns compiled once, case-insensitively, at import
+_COMPILED_EXPECTED_PATTERNS = {
+    rule_name: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for rule_name, patterns in EXPECTED_PATTERNS.items()
+}
+# One alternation per rule, so each file is scanned once for all its patterns
+_COMBINED_EXPECTED_PATTERNS = {
+    rule_name: _combine_patterns(patterns)
+    for rule_name, patterns in EXPECTED_PATTERNS.items()
+}
+
+# Expected patterns with no regex syntax, lowercased, so they can be checked
+# with a plain substring test against the lowercased file instead of a search
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_LITERAL_PATTERNS = {
+    p: p.lower()
+    for patterns in EXPECTED_PATTERNS.values()
+    for p in patterns
+    if not _REGEX_METACHARACTERS.intersection(p)
+}
+
+# Every file a coverage run reads, deduplicated across rules and the
+# orphan-scan table, so each is statted and read once per run
+_ENFORCEMENT_FILES = tuple(dict.fromkeys(
+    [f for info in CODE_ENFORCEMENT_MECHANISMS.values() for f in info["files"]]
+    + [info["file"] for info in ENFORCEMENT_PATTERNS.values()]
+))
+
+# Horizontal rules framing the coverage report and its sections
+REPORT_RULE = "=" * 70
+SECTION_RULE = "─" * 40
+
 # Rules that SHOULD have code enforcement but currently don't
 # This is the "gap" we want to close
 ENFORCEMENT_OPPORTUNITIES = {
@@ -151,12 +233,83 @@ class RuleCoverageAnalyzer:
         self.repo_root = Path(repo_root)
         self.registry = RuleRegistry()
         self._loaded = False
+        # path -> (mtime_ns, content), shared by the verify and orphan passes
+        self._file_cache: dict[Path, tuple[int, str]] = {}
+        # repo-relative path -> absolute Path / exists, since rules share
+        # enforcement files
+        self._paths: dict[str, Path] = {}
+        self._exists_cache: dict[str, bool] = {}
+        self._rule_lookup: list[tuple[str, str, str, re.Pattern]] = []
+        self._load_lock = threading.Lock()
 
     def _ensure_loaded(self):
-        if not self._loaded:
+        if self._loaded:
+            return
+        # Concurrent callers wait for a single load instead of repeating it
+        with self._load_lock:
+            if self._loaded:
+                return
             self.registry.load_rules()
+            # (name, snake_form, spaced_form, keywords_re) per rule, for
+            # matching enforcement lines without re-deriving the forms.
+            # keywords_re requires every keyword longer than 3 characters,
+            # one lookahead each, and matches anything if there are none.
+            self._rule_lookup = [
+                (
+                    name,
+                    name.replace("-", "_"),
+                    name.replace("-", " "),
+                    re.compile(
+                        "".join(
+                            f"(?=.*{re.escape(kw)})"
+                            for kw in name.split("-") if len(kw) > 3
+                        ),
+                        re.DOTALL,
+                    ),
+                )
+                for name in self.registry.rules
+            ]
             self._loaded = True
 
+    def _path(self, rel_path: str) -> Path:
+        """Resolve a repo-relative path, building each Path only once."""
+        path = self._paths.get(rel_path)
+        if path is None:
+            path = self._paths[rel_path] = self.repo_root / rel_path
+        return path
+
+    def _exists(self, rel_path: str) -> bool:
+        """Check whether a repo-relative file exists, statting it only once."""
+        exists = self._exists_cache.get(rel_path)
+        if exists is None:
+            exists = self._exists_cache[rel_path] = self._path(rel_path).exists()
+        return exists
+
+    def _read(self, path: Path) -> str:
+        """Read a file, reusing the cached content while its mtime is unchanged."""
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # Decoded once and shared: both passes report str lines, so scanning
+        # an mmap with bytes patterns would only move the decode elsewhere
+        content = path.read_text()
+        self._file_cache[path] = (mtime_ns, content)
+        return content
+
+    def _prefetch(self, paths: set[Path]) -> None:
+        """Read files into the cache concurrently; failures are left for the scan."""
+        def read(path: Path) -> None:
+            try:
+                self._read(path)
+            except (OSError, ValueError):
+                pass
+
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            list(executor.map(read, paths))
+
     def verify_enforcement(self, rule_name: str) -> EnforcementVerification:
         """Verify that a rule's enforcement mechanism exists and works."""
         self._ensure_loaded()
@@ -181,8 +334,7 @@ class RuleCoverageAnalyzer:
         files_exist = []
         files_missing = []
         for f in declared_files:
-            path = self.repo_root / f
-            if path.exists():
+            if self._exists(f):
                 files_exist.append(f)
             else:
                 files_missing.append(f)
@@ -193,16 +345,37 @@ class RuleCoverageAnalyzer:
 
         # Get expected patterns for this rule
         expected_patterns = self._get_expected_patterns(rule_name)
+        combined = _COMBINED_EXPECTED_PATTERNS.get(rule_name) or _combine_patterns(
+            [pat.pattern for pat in expected_patterns]
+        )
 
         for f in files_exist:
-            path = self.repo_root / f
             try:
-                content = path.read_text()
-                for pattern in expected_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        patterns_found.append(f"{f}: {pattern}")
+                content = self._read(self._path(f))
+                # Alternatives that matched in the single fused pass, which
+                # stops as soon as every pattern has been seen. A pattern can
+                # lose to an earlier alternative at the same position, so the
+                # rest are still confirmed on their own.
+                hits = set()
+                for m in combined.finditer(content):
+                    hits.add(m.lastgroup)
+                    if len(hits) == len(expected_patterns):
+                        break
+                content_lower = None
+                for i, pat in enumerate(expected_patterns):
+                    if f"p{i}" in hits:
+                        matched = True
+                    elif pat.pattern in _LITERAL_PATTERNS:
+                        if content_lower is None:
+                            content_lower = content.lower()
+                        matched = _LITERAL_PATTERNS[pat.pattern] in content_lower
+                    else:
+                        matched = pat.search(content) is not None
+
+                    if matched:
+                        patterns_found.append(f"{f}: {pat.pattern}")
                     else:
-                        patterns_missing.append(f"{f}: {pattern}")
+                        patterns_missing.append(f"{f}: {pat.pattern}")
             except IOError:
                 pass
 
@@ -232,97 +405,112 @@ class RuleCoverageAnalyzer:
             verification_notes="; ".join(notes),
         )
 
-    def _get_expected_patterns(self, rule_name: str) -> list[str]:
-        """Get expected code patterns for a rule."""
-        # Map rules to their expected patterns
-        pattern_map = {
-            "git-review-required": [r"REVIEW_APPROVED", r"review.*marker"],
-            "web-access-policy": [r"requests|httpx", r"BANNED|blocked"],
-            "agent-yaml-format": [r"yaml\.safe_load", r"\.yaml"],
-            "code-enforcement-principle": [r"enforcement", r"code.*enforc"],
-        }
-        return pattern_map.get(rule_name, [rule_name.replace("-", ".")])
+    def _get_expected_patterns(self, rule_name: str) -> list[re.Pattern]:
+        """Get expected code patterns for a rule, compiled."""
+        compiled = _COMPILED_EXPECTED_PATTERNS.get(rule_name)
+        if compiled is None:
+            compiled = [re.compile(rule_name.replace("-", "."), re.IGNORECASE)]
+        return compiled
 
     def find_orphaned_enforcement(self) -> list[OrphanedEnforcement]:
         """Find enforcement code that doesn't correspond to any rule."""
+        self._ensure_loaded()
         orphans = []
 
         # Check each enforcement file for patterns not tied to rules
         for name, info in ENFORCEMENT_PATTERNS.items():
-            file_path = self.repo_root / info["file"]
-            if not file_path.exists():
+            if not self._exists(info["file"]):
                 continue
+            file_path = self._path(info["file"])
 
             try:
-                content = file_path.read_text()
-                lines = content.split("\n")
-
-                for i, line in enumerate(lines, 1):
-                    # Look for enforcement-like patterns
-                    if self._looks_like_enforcement(line):
-                        # Check if this is tied to a known rule
-                        rule = self._find_rule_for_pattern(line)
-                        if not rule:
-                            orphans.append(OrphanedEnforcement(
-                                file=info["file"],
-                                pattern=line.strip()[:80],
-                                line_number=i,
-                                context=self._get_context(lines, i),
-                                suggested_rule=self._suggest_rule(line),
-                            ))
+                content = self._read(file_path)
             except IOError:
-                pass
+                continue
+
+            # Walk keyword hits over the whole file rather than every line,
+            # counting newlines only between consecutive hits
+            line_number = 1
+            counted_to = 0
+            line_end = -1
+            for m in _ENFORCEMENT_LINE_RE.finditer(content):
+                start = m.start()
+                if start < line_end:
+                    continue  # Line already reported
+                line_number += content.count("\n", counted_to, start)
+                counted_to = start
+                line_start = content.rfind("\n", 0, start) + 1
+                line_end = content.find("\n", start)
+                if line_end == -1:
+                    line_end = len(content)
+                line = content[line_start:line_end]
+
+                # Comments that only use the keywords in prose ("# reviewers
+                # MUST ...") are not enforcement; ones naming code still count
+                if line.lstrip().startswith("#") and not _IDENTIFIER_RE.search(line):
+                    continue
+
+                # Check if this is tied to a known rule
+                rule = self._find_rule_for_pattern(line)
+                if not rule:
+                    orphans.append(OrphanedEnforcement(
+                        file=info["file"],
+                        pattern=line.strip()[:80],
+                        line_number=line_number,
+                        context=self._get_context(content, line_start, line_end),
+                        suggested_rule=self._suggest_rule(line),
+                    ))
 
         return orphans
 
     def _looks_like_enforcement(self, line: str) -> bool:
         """Check if a line looks like enforcement code."""
-        enforcement_keywords = [
-            "BLOCKED", "DENIED", "PROHIBITED", "BANNED",
-            "MUST", "REQUIRED", "ENFORCE", "VALIDATE",
-            "ERROR.*not allowed", "reject", "refuse",
-        ]
-        line_lower = line.lower()
-        return any(kw.lower() in line_lower for kw in enforcement_keywords)
+        return _ENFORCEMENT_LINE_RE.search(line) is not None
 
     def _find_rule_for_pattern(self, line: str) -> Optional[str]:
-        """Find which rule a line of enforcement code is for."""
-        self._ensure_loaded()
+        """Find which rule a line of enforcement code is for.
+
+        Called per line, so the caller is responsible for _ensure_loaded().
+        """
+        # The orphan scan's only lowercase copy of a line: keyword detection
+        # and rule suggestions match with IGNORECASE regexes instead
         line_lower = line.lower()
 
-        for rule_name in self.registry.rules:
+        for rule_name, snake_form, spaced_form, keywords_re in self._rule_lookup:
             # Check if rule name appears in line
-            if rule_name.replace("-", "_") in line_lower or rule_name.replace("-", " ") in line_lower:
+            if snake_form in line_lower or spaced_form in line_lower:
                 return rule_name
 
             # Check if rule keywords appear
-            rule = self.registry.rules[rule_name]
-            keywords = rule_name.split("-")
-            if all(kw in line_lower for kw in keywords if len(kw) > 3):
+            if keywords_re.match(line_lower):
                 return rule_name
 
         return None
 
-    def _get_context(self, lines: list[str], line_num: int, context_size: int = 2) -> str:
-        """Get surrounding context for a line."""
-        start = max(0, line_num - context_size - 1)
-        end = min(len(lines), line_num + context_size)
-        return "\n".join(lines[start:end])
+    def _get_context(
+        self, content: str, line_start: int, line_end: int, context_size: int = 2
+    ) -> str:
+        """Get the lines surrounding content[line_start:line_end]."""
+        start = line_start
+        for _ in range(context_size):
+            if start == 0:
+                break
+            start = content.rfind("\n", 0, start - 1) + 1
+
+        end = line_end
+        for _ in range(context_size):
+            if end >= len(content):
+                break
+            end = content.find("\n", end + 1)
+            if end == -1:
+                end = len(content)
+
+        return content[start:end]
 
     def _suggest_rule(self, line: str) -> str:
         """Suggest a rule that this enforcement might relate to."""
-        line_lower = line.lower()
-        suggestions = {
-            "review": "git-review-required",
-            "import": "web-access-policy",
-            "yaml": "agent-yaml-format",
-            "commit": "git-checkpoint",
-            "file": "naming-conventions",
-        }
-        for keyword, rule in suggestions.items():
-            if keyword in line_lower:
-                return rule
-        return ""
+        m = _SUGGEST_RE.match(line)
+        return SUGGESTED_RULES[m.lastgroup] if m else ""
 
     def get_opportunities(self) -> list[dict]:
         """Get list of enforcement opportunities (rules that could be code-enforced)."""
@@ -341,11 +529,26 @@ class RuleCoverageAnalyzer:
                     "status": info.get("status", "not_implemented"),
                 })
 
-        return sorted(opportunities, key=lambda x: -self.registry.rules.get(x["rule"], type("R", (), {"priority": 0})()).priority if x["rule"] in self.registry.rules else 0)
+        # Every entry came from a loaded rule, so its priority is already here
+        return sorted(opportunities, key=itemgetter("priority"), reverse=True)
+
+    def analyze(self, timestamp: Optional[str] = None) -> CoverageReport:
+        """Run complete coverage analysis.
+
+        Args:
+            timestamp: Report timestamp to record, for callers that need
+                reproducible reports. Defaults to the current UTC time.
 
-    def analyze(self) -> CoverageReport:
-        """Run complete coverage analysis."""
+        Returns:
+            CoverageReport for every code-enforced rule
+        """
         self._ensure_loaded()
+        self._file_cache.clear()
+        self._exists_cache.clear()
+
+        # File reads release the GIL, so load every enforcement file up
+        # front in parallel; the regex scans below then hit the cache
+        self._prefetch({self._path(f) for f in _ENFORCEMENT_FILES if self._exists(f)})
 
         # Verify all code-enforced rules
         verifications = []
@@ -383,7 +586,7 @@ class RuleCoverageAnalyzer:
             summary_parts.append(f"Orphaned enforcement: {len(orphans)}")
 
         return CoverageReport(
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
             total_rules=total_rules,
             rules_with_code_enforcement=code_enforced,
             rules_verified=verified_count,
@@ -396,63 +599,75 @@ class RuleCoverageAnalyzer:
         )
 
 
+def _section_header(title: str) -> str:
+    """A report section title between two rules, preceded by a blank line."""
+    return f"\n{SECTION_RULE}\n{title}\n{SECTION_RULE}"
+
+
 def format_coverage_report(report: CoverageReport) -> str:
     """Format coverage report as human-readable text."""
-    lines = []
-
-    lines.append("=" * 70)
-    lines.append("RULE COVERAGE ANALYSIS")
-    lines.append("=" * 70)
-    lines.append(f"\n{report.summary}")
+    lines = [
+        f"{REPORT_RULE}\nRULE COVERAGE ANALYSIS\n{REPORT_RULE}\n\n{report.summary}",
+        _section_header("ENFORCEMENT VERIFICATION"),
+    ]
 
     # Verification results
-    lines.append(f"\n{'─' * 40}")
-    lines.append("ENFORCEMENT VERIFICATION")
-    lines.append(f"{'─' * 40}")
-
     for v in report.verifications:
         status = "✓" if v.is_verified else "✗"
-        lines.append(f"\n  {status} {v.rule_name}")
-        lines.append(f"    Mechanism: {v.mechanism}")
-        lines.append(f"    Files: {', '.join(v.files_exist)} ({len(v.files_missing)} missing)")
+        lines.append(
+            f"\n  {status} {v.rule_name}\n"
+            f"    Mechanism: {v.mechanism}\n"
+            f"    Files: {', '.join(v.files_exist)} ({len(v.files_missing)} missing)"
+        )
         if v.patterns_found:
             lines.append(f"    Patterns found: {len(v.patterns_found)}")
         lines.append(f"    Notes: {v.verification_notes}")
 
     # Orphaned enforcement
     if report.orphaned_enforcement:
-        lines.append(f"\n{'─' * 40}")
-        lines.append(f"ORPHANED ENFORCEMENT ({len(report.orphaned_enforcement)})")
-        lines.append(f"{'─' * 40}")
+        lines.append(_section_header(f"ORPHANED ENFORCEMENT ({len(report.orphaned_enforcement)})"))
         for orphan in report.orphaned_enforcement[:10]:  # Limit to 10
-            lines.append(f"\n  {orphan.file}:{orphan.line_number}")
-            lines.append(f"    Pattern: {orphan.pattern[:60]}...")
+            lines.append(f"\n  {orphan.file}:{orphan.line_number}\n    Pattern: {orphan.pattern[:60]}...")
             if orphan.suggested_rule:
                 lines.append(f"    Suggested rule: {orphan.suggested_rule}")
 
     # Opportunities
-    lines.append(f"\n{'─' * 40}")
-    lines.append("ENFORCEMENT OPPORTUNITIES")
-    lines.append(f"{'─' * 40}")
+    lines.append(_section_header("ENFORCEMENT OPPORTUNITIES"))
     for opp in report.opportunities:
         status_marker = "✓" if opp["status"] == "implemented" else "○"
-        lines.append(f"\n  {status_marker} {opp['rule']} (P{opp.get('priority', '?')})")
-        lines.append(f"    {opp['description']}")
-        lines.append(f"    Suggested: {opp['suggested_file']}")
+        lines.append(
+            f"\n  {status_marker} {opp['rule']} (P{opp.get('priority', '?')})\n"
+            f"    {opp['description']}\n"
+            f"    Suggested: {opp['suggested_file']}"
+        )
 
     # Coverage summary
-    lines.append(f"\n{'─' * 40}")
-    lines.append("COVERAGE METRICS")
-    lines.append(f"{'─' * 40}")
-    lines.append(f"  Total rules: {report.total_rules}")
-    lines.append(f"  Code-enforced: {report.rules_with_code_enforcement} ({report.rules_with_code_enforcement/report.total_rules*100:.1f}%)")
-    lines.append(f"  Verified: {report.rules_verified}/{report.rules_with_code_enforcement}")
-    lines.append(f"  Overall coverage: {report.coverage_percentage:.1f}%")
-
-    lines.append("\n" + "=" * 70)
+    lines.append(_section_header("COVERAGE METRICS"))
+    lines.append(
+        f"  Total rules: {report.total_rules}\n"
+        f"  Code-enforced: {report.rules_with_code_enforcement} ({report.rules_with_code_enforcement/report.total_rules*100:.1f}%)\n"
+        f"  Verified: {report.rules_verified}/{report.rules_with_code_enforcement}\n"
+        f"  Overall coverage: {report.coverage_percentage:.1f}%\n"
+        f"\n{REPORT_RULE}"
+    )
     return "\n".join(lines)
 
 
+def _print_json(data) -> None:
+    """Write data to stdout as indented JSON, streamed rather than built up.
+
+    Uses orjson when it is installed; otherwise json.dump() writes the
+    encoder's chunks as they are produced.
+    """
+    try:
+        import orjson
+    except ImportError:
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode() + "\n")
+
+
 def main():
     """CLI entry point."""
     import argparse
@@ -488,7 +703,7 @@ Examples:
     if args.verify:
         verification = analyzer.verify_enforcement(args.verify)
         if args.json:
-            print(json.dumps({
+            _print_json({
                 "rule": verification.rule_name,
                 "mechanism": verification.mechanism,
                 "files_exist": verification.files_exist,
@@ -496,7 +711,7 @@ Examples:
                 "patterns_found": verification.patterns_found,
                 "is_verified": verification.is_verified,
                 "notes": verification.verification_notes,
-            }, indent=2))
+            })
         else:
             status = "VERIFIED" if verification.is_verified else "FAILED"
             print(f"Rule: {verification.rule_name} - {status}")
@@ -507,12 +722,12 @@ Examples:
     elif args.orphans:
         orphans = analyzer.find_orphaned_enforcement()
         if args.json:
-            print(json.dumps([{
+            _print_json([{
                 "file": o.file,
                 "line": o.line_number,
                 "pattern": o.pattern,
                 "suggested_rule": o.suggested_rule,
-            } for o in orphans], indent=2))
+            } for o in orphans])
         else:
             print(f"Found {len(orphans)} orphaned enforcement patterns:")
             for o in orphans:
@@ -521,7 +736,7 @@ Examples:
     elif args.opportunities:
         opportunities = analyzer.get_opportunities()
         if args.json:
-            print(json.dumps(opportunities, indent=2))
+            _print_json(opportunities)
         else:
             print("Enforcement Opportunities:")
             for opp in opportunities:
@@ -531,7 +746,7 @@ Examples:
     else:
         report = analyzer.analyze()
         if args.json:
-            print(json.dumps({
+            _print_json({
                 "timestamp": report.timestamp,
                 "total_rules": report.total_rules,
                 "code_enforced": report.rules_with_code_enforcement,
@@ -545,7 +760,7 @@ Examples:
                 } for v in report.verifications],
                 "orphans": len(report.orphaned_enforcement),
                 "opportunities": len(report.opportunities),
-            }, indent=2))
+            })
         else:
             print(format_coverage_report(report))
 
@@ -33,11 +33,15 @@ import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # Enforcement level definitions
 class EnforcementLevel:
@@ -120,7 +124,7 @@ class RuleRegistry:
         for rule_file in self.rules_dir.glob("*.yaml"):
             try:
                 with open(rule_file) as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)
 
                 if not data or "name" not in data:
                     continue
@@ -167,7 +171,7 @@ class RuleRegistry:
     def get_rules_by_priority(self) -> list[Rule]:
         """Get all rules sorted by priority (highest first)."""
         self._ensure_loaded()
-        return sorted(self.rules.values(), key=lambda r: r.priority, reverse=True)
+        return sorted(self.rules.values(), key=attrgetter("priority"), reverse=True)
 
     def get_rules_for_agent(self, agent: str) -> list[Rule]:
         """Get rules that apply to a specific agent."""
@@ -183,7 +187,7 @@ class RuleRegistry:
                         break
             elif isinstance(rule.when, str) and agent in rule.when:
                 applicable.append(rule)
-        return sorted(applicable, key=lambda r: r.priority, reverse=True)
+        return sorted(applicable, key=attrgetter("priority"), reverse=True)
 
     def detect_conflicts(self) -> list[RuleConflict]:
         """Detect potential conflicts between rules."""
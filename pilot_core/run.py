@@ -31,6 +31,9 @@ from typing import Optional
 
 import yaml
 
+# libyaml-backed dumper when PyYAML was built with it
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def generate_run_id() -> str:
     """Generate unique run ID: YYYYMMDD_HHMMSS_shortuid"""
@@ -179,7 +182,7 @@ class Run:
         manifest_path = runs_dir / filename
 
         with open(manifest_path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.to_dict(), f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
         return manifest_path
 
@@ -125,21 +125,28 @@ def search(query: str, limit: int = 10, types: Optional[list[str]] = None) -> li
     # Sum scores across all terms
     score_expr = " + ".join(score_parts) if score_parts else "0"
 
+    # Rank on the score alone and build the content snippet only for the
+    # rows that survive the LIMIT, so discarded rows never re-serialize
+    # their content to JSON
     sql = f"""
-        SELECT path, name, type, description, score, content
+        SELECT
+            item.path as path,
+            item.name as name,
+            item.type as type,
+            item.description as description,
+            score,
+            left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
         FROM (
-            SELECT
-                item.path as path,
-                item.name as name,
-                item.type as type,
-                item.description as description,
-                ({score_expr}) as score,
-                left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
-            FROM index_items
-        ) scored
-        WHERE score > 0 {type_filter}
+            SELECT item, score
+            FROM (
+                SELECT item, item.type as type, ({score_expr}) as score
+                FROM index_items
+            ) scored
+            WHERE score > 0 {type_filter}
+            ORDER BY score DESC
+            LIMIT ?
+        ) top
         ORDER BY score DESC
-        LIMIT ?
     """
     params.append(limit)
 
@@ -187,15 +194,18 @@ def search_by_type(item_type: str, query: Optional[str] = None, limit: int = 20)
                 item.description as description,
                 1.0 as score,
                 left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
-            FROM index_items
-            WHERE item.type = ?
-            AND (
-                lower(item.name) LIKE lower('%' || ? || '%')
-                OR lower(item.description) LIKE lower('%' || ? || '%')
-                OR lower(COALESCE(item.text, '')) LIKE lower('%' || ? || '%')
-                OR lower(CAST(item.content AS VARCHAR)) LIKE lower('%' || ? || '%')
-            )
-            LIMIT ?
+            FROM (
+                SELECT item
+                FROM index_items
+                WHERE item.type = ?
+                AND (
+                    lower(item.name) LIKE lower('%' || ? || '%')
+                    OR lower(item.description) LIKE lower('%' || ? || '%')
+                    OR lower(COALESCE(item.text, '')) LIKE lower('%' || ? || '%')
+                    OR lower(CAST(item.content AS VARCHAR)) LIKE lower('%' || ? || '%')
+                )
+                LIMIT ?
+            ) matched
         """
         params = [item_type, query, query, query, query, limit]
     else:
@@ -207,9 +217,12 @@ def search_by_type(item_type: str, query: Optional[str] = None, limit: int = 20)
                 item.description as description,
                 1.0 as score,
                 left(COALESCE(item.text, CAST(item.content AS VARCHAR)), 500) as content
-            FROM index_items
-            WHERE item.type = ?
-            LIMIT ?
+            FROM (
+                SELECT item
+                FROM index_items
+                WHERE item.type = ?
+                LIMIT ?
+            ) matched
         """
         params = [item_type, limit]
 
@@ -263,13 +276,17 @@ def similar_to(text: str, limit: int = 5) -> list[SearchResult]:
             item.name as name,
             item.type as type,
             item.description as description,
-            list_cosine_similarity(item.embedding, ?) as score,
+            score,
             left(CAST(item.content AS VARCHAR), 500) as content
-        FROM index_items
-        WHERE item.embedding IS NOT NULL
-        AND len(item.embedding) > 0
+        FROM (
+            SELECT item, list_cosine_similarity(item.embedding, ?) as score
+            FROM index_items
+            WHERE item.embedding IS NOT NULL
+            AND len(item.embedding) > 0
+            ORDER BY score DESC
+            LIMIT ?
+        ) top
         ORDER BY score DESC
-        LIMIT ?
     """
 
     try:
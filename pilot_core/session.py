@@ -20,8 +20,10 @@ Each JSONL line contains:
 
 import json
 import os
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -141,7 +143,11 @@ class Message:
 
 @dataclass
 class Session:
-    """A Claude Code session."""
+    """A Claude Code session.
+
+    The derived file, command and todo lists are computed on first access
+    and cached, so sessions must not be mutated after construction.
+    """
     session_id: str
     project_path: str
     started_at: datetime
@@ -160,7 +166,7 @@ class Session:
         delta = self.last_activity - self.started_at
         return delta.total_seconds() / 60
 
-    @property
+    @cached_property
     def files_read(self) -> list[str]:
         """Files that were read during session."""
         files = []
@@ -169,7 +175,7 @@ class Session:
                 files.append(tc.input["file_path"])
         return list(set(files))
 
-    @property
+    @cached_property
     def files_written(self) -> list[str]:
         """Files that were written/edited during session."""
         files = []
@@ -178,7 +184,7 @@ class Session:
                 files.append(tc.input["file_path"])
         return list(set(files))
 
-    @property
+    @cached_property
     def bash_commands(self) -> list[str]:
         """Bash commands that were run."""
         commands = []
@@ -187,7 +193,7 @@ class Session:
                 commands.append(tc.input["command"])
         return commands
 
-    @property
+    @cached_property
     def pending_todos(self) -> list[dict]:
         """Todos that are not completed."""
         return [t for t in self.todos if t.get("status") != "completed"]
@@ -292,21 +298,56 @@ def _extract_thinking_from_message(msg_data: dict) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4)
+def _sorted_session_ids(project_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """Sorted session IDs in a project directory.
+
+    Cached per directory mtime, which changes whenever a session file is
+    added or removed.
+    """
+    sessions = []
+    for f in Path(project_dir).glob("*.jsonl"):
+        # Skip agent sessions (they're linked from main sessions)
+        if not f.name.startswith("agent-"):
+            sessions.append(f.stem)
+
+    return tuple(sorted(sessions))
+
+
 def list_project_sessions(project_path: str) -> list[str]:
-    """List all session IDs for a given project path."""
+    """List all session IDs for a given project path, sorted."""
     encoded = _encode_project_path(project_path)
     project_dir = PROJECTS_DIR / encoded
 
-    if not project_dir.exists():
+    try:
+        mtime_ns = project_dir.stat().st_mtime_ns
+    except OSError:
         return []
 
-    sessions = []
-    for f in project_dir.glob("*.jsonl"):
-        # Skip agent sessions (they're linked from main sessions)
-        if not f.name.startswith("agent-"):
-            sessions.append(f.stem)
+    return list(_sorted_session_ids(str(project_dir), mtime_ns))
+
+
+def find_sessions_by_prefix(project_path: str, prefix: str) -> list[str]:
+    """
+    Find the session IDs in a project that start with a prefix.
+
+    Args:
+        project_path: Project whose sessions to search
+        prefix: Leading characters of the session ID
+
+    Returns:
+        Matching session IDs, sorted
+    """
+    session_ids = list_project_sessions(project_path)
 
-    return sessions
+    # IDs are sorted, so the matches form one run starting at the prefix
+    matches = []
+    for sid in session_ids[bisect_left(session_ids, prefix):]:
+        if not sid.startswith(prefix):
+            break
+        matches.append(sid)
+
+    return matches
 
 
 def list_all_projects() -> list[tuple[str, str]]:
@@ -323,13 +364,27 @@ def list_all_projects() -> list[tuple[str, str]]:
     return projects
 
 
-def load_session(project_path: str, session_id: str) -> Optional[Session]:
-    """Load a session by project path and session ID."""
-    encoded = _encode_project_path(project_path)
-    session_file = PROJECTS_DIR / encoded / f"{session_id}.jsonl"
+@dataclass(frozen=True)
+class _ParsedSession:
+    """Time-independent contents of a session file."""
+    messages: list[Message]
+    tool_calls: list[ToolCall]
+    todos: list[dict]
+    initial_prompt: str
+    last_error: Optional[str]
+    agent_sessions: list[str]
+    started_at: Optional[datetime]  # None when no record had a timestamp
+    last_activity: Optional[datetime]
 
-    if not session_file.exists():
-        return None
+
+@lru_cache(maxsize=32)
+def _parse_session_file(path: str, mtime_ns: int, size: int) -> _ParsedSession:
+    """Parse a session JSONL file.
+
+    Cached per (path, mtime_ns, size), so an unchanged file is parsed once
+    per process and any write to it is picked up by the next load.
+    """
+    session_file = Path(path)
 
     messages = []
     tool_calls = []
@@ -449,65 +504,101 @@ def load_session(project_path: str, session_id: str) -> Optional[Session]:
                         if agent_id:
                             agent_sessions.append(agent_id)
 
+    return _ParsedSession(
+        messages=messages,
+        tool_calls=tool_calls,
+        todos=todos,
+        initial_prompt=initial_prompt,
+        last_error=last_fatal_error,  # Only fatal errors
+        agent_sessions=agent_sessions,
+        started_at=min(timestamps) if timestamps else None,
+        last_activity=max(timestamps) if timestamps else None,
+    )
+
+
+def _session_status(
+    last_activity: datetime, todos: list[dict], last_error: Optional[str]
+) -> str:
+    """Classify a session from its todos, last fatal error and idle time."""
+    # Check for stuck conditions (using UTC for comparison)
+    minutes_since_activity = (_utcnow() - last_activity).total_seconds() / 60
+
+    has_pending_todos = any(t.get("status") == "pending" for t in todos)
+    has_in_progress_todos = any(t.get("status") == "in_progress" for t in todos)
+    has_fatal_error = last_error is not None
+
+    # Status determination priority:
+    # 1. Fatal error = "error" (only if truly blocking)
+    # 2. Has incomplete todos + stale = "stuck"
+    # 3. Has incomplete todos + active = "in_progress"
+    # 4. All todos done = "completed"
+    # 5. No todos + very stale = "abandoned"
+    # 6. Otherwise = "in_progress"
+
+    if has_fatal_error and minutes_since_activity > 2:
+        # Only mark as error if session stopped after the error
+        # (not if it recovered and continued)
+        return "error"
+    elif has_pending_todos or has_in_progress_todos:
+        # Increased threshold: 15 minutes without activity = stuck
+        # (was 5 minutes, which is too aggressive)
+        if minutes_since_activity > 15:
+            return "stuck"
+        else:
+            return "in_progress"
+    else:
+        # Check if it looks complete
+        all_todos_done = todos and all(t.get("status") == "completed" for t in todos)
+        if all_todos_done:
+            return "completed"
+        # Increased threshold: 2 hours without activity = abandoned
+        # (was 30 minutes, which is too aggressive)
+        elif minutes_since_activity > 120:
+            return "abandoned"
+        else:
+            return "in_progress"
+
+
+def load_session(project_path: str, session_id: str) -> Optional[Session]:
+    """Load a session by project path and session ID.
+
+    The file is parsed once per change (see _parse_session_file); the
+    status is recomputed on every load because it depends on how long the
+    session has been idle. Sessions from the same parse share their
+    Message and ToolCall objects, so treat them as read-only.
+    """
+    encoded = _encode_project_path(project_path)
+    session_file = PROJECTS_DIR / encoded / f"{session_id}.jsonl"
+
+    try:
+        st = session_file.stat()
+    except OSError:
+        return None
+
+    parsed = _parse_session_file(str(session_file), st.st_mtime_ns, st.st_size)
+
     # Determine timestamps
-    if not timestamps:
+    if parsed.last_activity is None:
         started_at = _utcnow()
         last_activity = _utcnow()
         status = "empty"
     else:
-        started_at = min(timestamps)
-        last_activity = max(timestamps)
-
-        # Check for stuck conditions (using UTC for comparison)
-        minutes_since_activity = (_utcnow() - last_activity).total_seconds() / 60
-
-        has_pending_todos = any(t.get("status") == "pending" for t in todos)
-        has_in_progress_todos = any(t.get("status") == "in_progress" for t in todos)
-        has_fatal_error = last_fatal_error is not None
-
-        # Status determination priority:
-        # 1. Fatal error = "error" (only if truly blocking)
-        # 2. Has incomplete todos + stale = "stuck"
-        # 3. Has incomplete todos + active = "in_progress"
-        # 4. All todos done = "completed"
-        # 5. No todos + very stale = "abandoned"
-        # 6. Otherwise = "in_progress"
-
-        if has_fatal_error and minutes_since_activity > 2:
-            # Only mark as error if session stopped after the error
-            # (not if it recovered and continued)
-            status = "error"
-        elif has_pending_todos or has_in_progress_todos:
-            # Increased threshold: 15 minutes without activity = stuck
-            # (was 5 minutes, which is too aggressive)
-            if minutes_since_activity > 15:
-                status = "stuck"
-            else:
-                status = "in_progress"
-        else:
-            # Check if it looks complete
-            all_todos_done = todos and all(t.get("status") == "completed" for t in todos)
-            if all_todos_done:
-                status = "completed"
-            # Increased threshold: 2 hours without activity = abandoned
-            # (was 30 minutes, which is too aggressive)
-            elif minutes_since_activity > 120:
-                status = "abandoned"
-            else:
-                status = "in_progress"
+        started_at = parsed.started_at
+        last_activity = parsed.last_activity
+        status = _session_status(last_activity, parsed.todos, parsed.last_error)
 
     return Session(
         session_id=session_id,
         project_path=project_path,
         started_at=started_at,
         last_activity=last_activity,
-        messages=messages,
-        tool_calls=tool_calls,
-        todos=todos,
+        messages=list(parsed.messages),
+        tool_calls=list(parsed.tool_calls),
+        todos=list(parsed.todos),
         status=status,
-        initial_prompt=initial_prompt,
-        last_error=last_fatal_error,  # Only fatal errors
-        agent_sessions=agent_sessions,
+        initial_prompt=parsed.initial_prompt,
+        last_error=parsed.last_error,
+        agent_sessions=list(parsed.agent_sessions),
     )
 
 
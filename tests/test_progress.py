@@ -13,6 +13,10 @@ Tests cover:
 Run with: uv run pytest tests/test_progress.py -v
 """
 
+import sys
+import threading
+import time
+
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -26,6 +30,8 @@ from pilot_core.progress import (
     list_progress,
     update_progress,
     update_heartbeat,
+    bump_messages,
+    flush_progress,
     mark_completed,
     mark_failed,
     is_stale,
@@ -166,6 +172,14 @@ class TestWriteProgress:
         assert data["agent"] == sample_progress.agent
         assert data["status"] == "running"
 
+    def test_write_leaves_no_temp_files(self, test_project, sample_progress, tmp_path):
+        """Atomic write publishes the file and removes its temp copy."""
+        write_progress(test_project, sample_progress)
+        write_progress(test_project, sample_progress)
+
+        progress_dir = tmp_path / "projects" / test_project / ".progress"
+        assert not [p.name for p in progress_dir.iterdir() if ".tmp" in p.name]
+
 
 class TestReadProgress:
     """Tests for read_progress function."""
@@ -309,6 +323,24 @@ class TestUpdateHeartbeat:
         assert result.messages_processed == 42
 
 
+class TestBumpMessages:
+    """Tests for bump_messages function."""
+
+    def test_bump_increments_counter(self, test_project, sample_progress):
+        """bump_messages adds to messages_processed."""
+        write_progress(test_project, sample_progress)
+
+        bump_messages(test_project, sample_progress.run_id)
+        result = bump_messages(test_project, sample_progress.run_id, n=4)
+
+        assert result.messages_processed == 5
+        assert result.phase == sample_progress.phase
+
+    def test_bump_nonexistent_returns_none(self, test_project):
+        """bump_messages returns None for nonexistent file."""
+        assert bump_messages(test_project, "nonexistent") is None
+
+
 class TestMarkCompleted:
     """Tests for mark_completed function."""
 
@@ -562,6 +594,197 @@ class TestRoundTrip:
         assert restored.artifacts_created == original.artifacts_created
 
 
+class TestDebouncedWrites:
+    """Tests for debounced progress flushing."""
+
+    def _disk_phase(self, tmp_path, project, run_id):
+        path = tmp_path / "projects" / project / ".progress" / f"{run_id}.yaml"
+        return yaml.safe_load(path.read_text())["phase"]
+
+    def test_rapid_heartbeats_are_debounced(self, test_project, sample_progress, tmp_path):
+        """Heartbeats within the flush interval stay in memory."""
+        write_progress(test_project, sample_progress)
+
+        update_heartbeat(test_project, sample_progress.run_id, phase="Step 1")
+        update_heartbeat(test_project, sample_progress.run_id, phase="Step 2")
+
+        assert self._disk_phase(tmp_path, test_project, sample_progress.run_id) == "Initializing"
+        assert read_progress(test_project, sample_progress.run_id).phase == "Step 2"
+
+    def test_flush_progress_writes_pending(self, test_project, sample_progress, tmp_path):
+        """flush_progress writes debounced updates to disk."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Pending")
+
+        assert flush_progress(test_project) == 1
+        assert self._disk_phase(tmp_path, test_project, sample_progress.run_id) == "Pending"
+
+    def test_deferred_update_flushed_by_timer(self, test_project, sample_progress, tmp_path):
+        """A deferred update reaches disk without a further update."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Last step")
+
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            if self._disk_phase(tmp_path, test_project, sample_progress.run_id) == "Last step":
+                break
+            time.sleep(0.05)
+
+        assert self._disk_phase(tmp_path, test_project, sample_progress.run_id) == "Last step"
+
+    def test_read_returns_copy_of_pending(self, test_project, sample_progress):
+        """Mutating a read result does not change the cached progress."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Pending")
+
+        read_progress(test_project, sample_progress.run_id).phase = "Mutated"
+
+        assert read_progress(test_project, sample_progress.run_id).phase == "Pending"
+
+    def test_terminal_status_flushes_immediately(self, test_project, sample_progress, tmp_path):
+        """mark_completed writes through even inside the flush interval."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Working")
+
+        mark_completed(test_project, sample_progress.run_id, "Done")
+
+        path = tmp_path / "projects" / test_project / ".progress" / f"{sample_progress.run_id}.yaml"
+        data = yaml.safe_load(path.read_text())
+        assert data["status"] == "completed"
+        assert data["phase"] == "Working"
+
+    def test_external_write_is_not_clobbered(self, test_project, sample_progress, tmp_path):
+        """Updates re-read the file when another writer replaced it."""
+        write_progress(test_project, sample_progress)
+        path = tmp_path / "projects" / test_project / ".progress" / f"{sample_progress.run_id}.yaml"
+        data = yaml.safe_load(path.read_text())
+        data["result_summary"] = "Written elsewhere"
+        path.write_text(yaml.dump(data))
+
+        result = update_heartbeat(test_project, sample_progress.run_id, phase="Later")
+
+        assert result.result_summary == "Written elsewhere"
+
+    def test_list_progress_sees_pending_updates(self, test_project, sample_progress):
+        """list_progress flushes pending updates first."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Listed")
+
+        listed = list_progress(test_project)
+
+        assert [p.phase for p in listed] == ["Listed"]
+
+
+class TestWaitForAgent:
+    """Tests for wait_for_agent function."""
+
+    def test_returns_completed_progress(self, test_project, sample_progress):
+        """wait_for_agent returns immediately for a completed run."""
+        sample_progress.status = ProgressStatus.COMPLETED
+        write_progress(test_project, sample_progress)
+
+        result = wait_for_agent(test_project, sample_progress.run_id, timeout=5, poll_interval=1)
+
+        assert result.status == ProgressStatus.COMPLETED
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_wakes_on_file_change_before_poll_interval(self, test_project, sample_progress):
+        """On Linux, completion is noticed without waiting a full poll_interval."""
+        write_progress(test_project, sample_progress)
+
+        timer = threading.Timer(
+            0.2, mark_completed, args=(test_project, sample_progress.run_id, "Done")
+        )
+        timer.start()
+        started = time.monotonic()
+        try:
+            result = wait_for_agent(test_project, sample_progress.run_id, timeout=30, poll_interval=10)
+        finally:
+            timer.join()
+
+        assert result.status == ProgressStatus.COMPLETED
+        assert time.monotonic() - started < 5
+
+
+class TestProgressIndex:
+    """Tests for the index.jsonl summary index."""
+
+    def test_summary_listing_uses_index(self, test_project, sample_progress, tmp_path):
+        """list_progress(full=False) serves summaries without parsing files."""
+        sample_progress.result_summary = "Only in the full file"
+        write_progress(test_project, sample_progress)
+        update_progress(test_project, sample_progress.run_id, status="completed")
+
+        summaries = list_progress(test_project, full=False)
+
+        assert len(summaries) == 1
+        assert summaries[0].status == ProgressStatus.COMPLETED
+        assert summaries[0].result_summary == ""
+
+    def test_summary_listing_skips_removed_runs(self, test_project, sample_progress):
+        """Runs archived since being indexed are not listed."""
+        write_progress(test_project, sample_progress)
+        archive_progress(test_project, sample_progress.run_id)
+
+        assert list_progress(test_project, full=False) == []
+
+    def test_cleanup_compacts_index(self, test_project, tmp_path):
+        """cleanup_progress rewrites the index with one line per survivor."""
+        for i, age in enumerate([48, 1]):
+            progress = ProgressFile(
+                run_id=f"run_{i}",
+                agent="builder",
+                project=test_project,
+                started_at=datetime.now() - timedelta(hours=age),
+                status=ProgressStatus.COMPLETED,
+                last_heartbeat=datetime.now() - timedelta(hours=age),
+            )
+            write_progress(test_project, progress)
+            write_progress(test_project, progress)
+
+        cleanup_progress(test_project, max_age_hours=24)
+
+        index = tmp_path / "projects" / test_project / ".progress" / "index.jsonl"
+        lines = index.read_text().splitlines()
+        assert len(lines) == 1
+        assert '"run_1"' in lines[0]
+
+    def test_heartbeats_do_not_grow_index(self, test_project, sample_progress, tmp_path):
+        """Only the first write and status changes append index lines."""
+        write_progress(test_project, sample_progress)
+        for phase in ["Step 1", "Step 2", "Step 3"]:
+            update_heartbeat(test_project, sample_progress.run_id, phase=phase)
+            flush_progress(test_project)
+        mark_completed(test_project, sample_progress.run_id, "Done")
+
+        index = tmp_path / "projects" / test_project / ".progress" / "index.jsonl"
+        lines = index.read_text().splitlines()
+        assert len(lines) == 2
+        assert '"completed"' in lines[1]
+
+    def test_summary_listing_reads_active_runs_from_file(self, test_project, sample_progress):
+        """Running runs report their latest phase, not the indexed one."""
+        write_progress(test_project, sample_progress)
+        update_heartbeat(test_project, sample_progress.run_id, phase="Step 1")
+
+        summaries = list_progress(test_project, full=False)
+
+        assert summaries[0].phase == "Step 1"
+
+    def test_compaction_keeps_runs_indexed_since_scan(self, test_project, sample_progress, tmp_path):
+        """Index lines appended after cleanup scanned the files survive."""
+        import pilot_core.progress as progress_module
+
+        write_progress(test_project, sample_progress)
+        progress_dir = tmp_path / "projects" / test_project / ".progress"
+
+        progress_module._compact_index(progress_dir, [], [])
+
+        lines = (progress_dir / "index.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert f'"{sample_progress.run_id}"' in lines[0]
+
+
 # Run with: uv run pytest tests/test_progress.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
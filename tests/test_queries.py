@@ -18,6 +18,8 @@ from pilot_core.queries import (
     TemplateNotFoundError,
     _template_cache,
     QUERIES_DIR,
+    escape_like,
+    json_path,
 )
 
 from pilot_core.query_builder import QueryBuilder, query
@@ -609,6 +611,14 @@ class TestQueryBuilderWhere:
             sql, _ = QueryBuilder().where(field, "value").to_sql()
             assert f"unnest.{field} = :p1" in sql
 
+    def test_where_content_field_binds_path(self):
+        """Content fields should be selected by a bound JSON path."""
+        sql, params = QueryBuilder().where("model", "opus").to_sql()
+
+        assert "json_extract_string(unnest.content, :p1_path) = :p1" in sql
+        assert "model" not in sql
+        assert params["p1_path"] == '$."model"'
+
 
 class TestQueryBuilderWhereLike:
     """Tests for QueryBuilder.where_like() method."""
@@ -634,7 +644,7 @@ class TestQueryBuilderSearch:
         """search() should search across name, description, and text."""
         sql, params = QueryBuilder().search("test").to_sql()
 
-        assert "lower(unnest.name) LIKE lower(:search_term)" in sql
+        assert "lower(unnest.name) LIKE :search_term" in sql
         assert "lower(COALESCE(unnest.description, ''))" in sql
         assert params["search_term"] == "%test%"
 
@@ -651,6 +661,55 @@ class TestQueryBuilderSearch:
         assert "ORDER BY" in sql
         assert "CASE WHEN" in sql
 
+    def test_search_term_lowercased_once(self):
+        """The search pattern should be lowercased in Python, not in SQL."""
+        sql, params = QueryBuilder().search("Web").to_sql()
+
+        assert params["search_term"] == "%web%"
+        assert "lower(:search_term)" not in sql
+
+    def test_search_escapes_wildcards(self):
+        """% and _ in the query should match literally."""
+        sql, params = QueryBuilder().search("web_%").to_sql()
+
+        assert params["search_term"] == "%web\\_\\%%"
+        assert "ESCAPE" in sql
+
+
+class TestQueryBuilderStartsWith:
+    """Tests for QueryBuilder.starts_with() method."""
+
+    def test_starts_with_prefix_pattern(self):
+        """starts_with() should generate an escaped prefix LIKE."""
+        sql, params = QueryBuilder().starts_with("name", "web_").to_sql()
+
+        assert "unnest.name LIKE :p1 ESCAPE" in sql
+        assert params["p1"] == "web\\_%"
+
+
+class TestEscapeLike:
+    """Tests for escape_like()."""
+
+    def test_escapes_metacharacters(self):
+        """Backslash, % and _ should be backslash-escaped."""
+        assert escape_like("a_b%c\\d") == "a\\_b\\%c\\\\d"
+
+    def test_plain_text_unchanged(self):
+        """Text without metacharacters should pass through."""
+        assert escape_like("web search") == "web search"
+
+
+class TestJsonPath:
+    """Tests for json_path()."""
+
+    def test_quotes_key(self):
+        """The key should be quoted so dots stay part of the name."""
+        assert json_path("a.b") == '$."a.b"'
+
+    def test_escapes_quotes(self):
+        """Quotes and backslashes in the key should be escaped."""
+        assert json_path('say "hi"\\') == '$."say \\"hi\\"\\\\"'
+
 
 class TestQueryBuilderContentContains:
     """Tests for QueryBuilder.content_contains() method."""
@@ -943,6 +1002,30 @@ class TestIntegration:
         assert results[0]["name"] == "builder"
         assert results[1]["name"] == "web-researcher"
 
+    def test_search_underscore_is_literal(self, tmp_index_file, monkeypatch):
+        """An underscore in the search term should not match any character."""
+        monkeypatch.chdir(tmp_index_file.parent.parent)
+
+        results = QueryBuilder().search("web_").execute()
+
+        assert [r["name"] for r in results] == ["web_search"]
+
+    def test_starts_with_finds_prefix(self, tmp_index_file, monkeypatch):
+        """starts_with() should match items by literal name prefix."""
+        monkeypatch.chdir(tmp_index_file.parent.parent)
+
+        results = QueryBuilder().starts_with("name", "web").order_by("name").execute()
+
+        assert [r["name"] for r in results] == ["web-researcher", "web_search"]
+
+    def test_where_content_field(self, tmp_index_file, monkeypatch):
+        """where() on a content field should match through the JSON path."""
+        monkeypatch.chdir(tmp_index_file.parent.parent)
+
+        results = QueryBuilder().where("model", "opus").execute()
+
+        assert [r["name"] for r in results] == ["builder"]
+
     def test_search_finds_matches(self, tmp_index_file, monkeypatch):
         """Search should find items matching the term."""
         monkeypatch.chdir(tmp_index_file.parent.parent)
@@ -0,0 +1,342 @@
+"""
+Unit tests for the repo_search DuckDB layer.
+
+Tests:
+- Index materialized once and shared across searches
+- Index reloaded when the index file changes
+- Fixed-shape keyword and regex queries
+- Concurrent search_everything()
+- Semantic search over packed embeddings
+- Merged find() results
+- context_for() short-circuiting
+- Query embedding cache
+- Persisted DuckDB index snapshot
+- find_by_type() dispatch
+- Regex field matching
+- Index freshness check
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from pilot_core import repo_search
+from pilot_core.embed import embed
+
+
+def _write_index(path, items):
+    """Write a minimal index.json with a fresh generated_at."""
+    path.write_text(json.dumps({
+        "generated_at": datetime.now().isoformat(),
+        "items": items,
+    }))
+
+
+def _item(name, item_type="code"):
+    return {
+        "path": f"{name}.py",
+        "name": name,
+        "type": item_type,
+        "description": f"{name} description",
+        "text": f"def {name}(): pass",
+        "content": {"kind": item_type},
+        "tags": [item_type],
+        "embedding": embed(f"{name} {item_type}"),
+    }
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    """Point repo_search at a temporary index and reset its connection cache."""
+    path = tmp_path / "index.json"
+    _write_index(path, [_item("alpha"), _item("beta", "rule")])
+    monkeypatch.setattr(repo_search, "INDEX_PATH", path)
+    monkeypatch.setattr(repo_search, "_CONN", None)
+    monkeypatch.setattr(repo_search, "_CONN_MTIME", None)
+    monkeypatch.setattr(repo_search, "_last_index_check", float("-inf"))
+    repo_search._embed_cached.cache_clear()
+    return path
+
+
+class TestConnectionCache:
+    """Tests for the cached in-memory index database."""
+
+    def test_index_loaded_once(self, index_path, monkeypatch):
+        """Repeated searches reuse the materialized index."""
+        loads = []
+        original = repo_search._load_index_table
+        monkeypatch.setattr(
+            repo_search, "_load_index_table",
+            lambda con: (loads.append(1), original(con)),
+        )
+
+        assert repo_search.list_types() == {"code": 1, "rule": 1}
+        assert repo_search.keyword("alpha")[0]["name"] == "alpha"
+        assert repo_search.structured(item_type="rule")[0]["name"] == "beta"
+        assert len(loads) == 1
+
+    def test_reloads_when_index_changes(self, index_path):
+        """A rewritten index file is picked up by the next search."""
+        assert repo_search.list_types() == {"code": 1, "rule": 1}
+
+        _write_index(index_path, [_item("gamma", "tool")])
+        st = index_path.stat()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert repo_search.list_types() == {"tool": 1}
+
+    def test_open_cursor_survives_reload(self, index_path):
+        """Cursors handed out before a reload keep working."""
+        con = repo_search._get_connection()
+
+        _write_index(index_path, [_item("gamma", "tool")])
+        st = index_path.stat()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        repo_search._get_connection()
+
+        assert con.execute("SELECT count(*) FROM index_items").fetchone()[0] == 2
+
+
+class TestSearchTemplates:
+    """Tests for the fixed-shape search queries."""
+
+    def test_keyword_type_filter(self, index_path):
+        """Type filters are bound as a list parameter."""
+        results = repo_search.keyword("description", types=["rule"])
+        assert [r["name"] for r in results] == ["beta"]
+
+    def test_keyword_type_filter_is_not_sql(self, index_path):
+        """Quotes in type names can't alter the query."""
+        assert repo_search.keyword("description", types=["x') OR ('1'='1"]) == []
+
+    def test_keyword_wildcards_are_literal(self, index_path):
+        """% and _ in a term match themselves, not any character."""
+        assert repo_search.keyword("alpha_") == []
+        assert repo_search.keyword("%") == []
+
+    def test_keyword_ignores_terms_past_slots(self, index_path):
+        """Only the first KEYWORD_TERM_SLOTS terms are scored."""
+        filler = " ".join(["zz"] * repo_search.KEYWORD_TERM_SLOTS)
+        assert repo_search.keyword(f"{filler} alpha") == []
+        assert repo_search.keyword(f"alpha {filler}")[0]["name"] == "alpha"
+
+    def test_ranked_queries_use_top_n(self, index_path):
+        """Ranked templates are planned as a top-k, not a full sort."""
+        con = repo_search._get_connection()
+        plan = con.execute(
+            "EXPLAIN " + repo_search._KEYWORD_SQL,
+            repo_search._keyword_params("alpha", None, 5),
+        ).fetchall()[0][1]
+        assert "TOP_N" in plan
+
+    def test_structured_field_path_is_bound(self, index_path):
+        """Content fields are matched through a bound JSON path."""
+        assert [r["name"] for r in repo_search.structured(field="kind", value="rul")] == ["beta"]
+        assert repo_search.structured(field="kind') OR ('1'='1", value="x") == []
+
+    def test_regex_type_filter(self, index_path):
+        """Regex search honours the type filter."""
+        assert [r["name"] for r in repo_search.regex("def", types=["code"])] == ["alpha"]
+
+
+class TestSearchEverything:
+    """Tests for the concurrent search_everything() fan-out."""
+
+    def test_returns_every_method(self, index_path, monkeypatch):
+        """All methods report results, in the documented order."""
+        monkeypatch.setattr(repo_search, "embed", lambda text: None)
+
+        results = repo_search.search_everything("alpha")
+
+        assert list(results) == [
+            "keyword", "semantic", "regex", "agents", "rules",
+            "tools", "code", "decisions", "lessons", "research",
+        ]
+        assert results["keyword"][0]["name"] == "alpha"
+        assert results["code"][0]["name"] == "alpha"
+        assert results["rules"] == []
+
+
+class TestSemantic:
+    """Tests for semantic search over the packed embedding column."""
+
+    def test_ranks_closest_embedding_first(self, index_path):
+        """The item whose embedding matches the query scores highest."""
+        results = repo_search.semantic("beta rule", limit=2)
+        assert results[0]["name"] == "beta"
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+    def test_skips_embeddings_of_other_dimensions(self, index_path):
+        """Items with foreign-sized embeddings are left out, not fatal."""
+        odd = _item("gamma", "tool")
+        odd["embedding"] = [1.0, 0.0]
+        _write_index(index_path, [_item("alpha"), odd])
+
+        results = repo_search.semantic("gamma tool", limit=5)
+        assert [r["name"] for r in results] == ["alpha"]
+
+    def test_unnormalized_embeddings_score_as_cosine(self, index_path):
+        """Index embeddings are normalized when the index is materialized."""
+        scaled = _item("beta", "rule")
+        scaled["embedding"] = [3 * x for x in scaled["embedding"]]
+        zero = _item("gamma", "tool")
+        zero["embedding"] = [0.0] * len(scaled["embedding"])
+        _write_index(index_path, [_item("alpha"), scaled, zero])
+
+        results = repo_search.semantic("beta rule", limit=5)
+        assert results[0]["name"] == "beta"
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+        assert "gamma" not in [r["name"] for r in results]
+
+
+class TestFind:
+    """Tests for the merged keyword + semantic find()."""
+
+    def test_dedupes_paths_keeping_best_score(self, index_path):
+        """A path hit by both searches appears once with its keyword score."""
+        results = repo_search.find("alpha", limit=10)
+
+        paths = [r["path"] for r in results]
+        assert len(paths) == len(set(paths))
+        assert results[0]["name"] == "alpha"
+        assert results[0]["score"] == 10
+
+    def test_respects_limit(self, index_path):
+        """The merged result is capped at limit."""
+        assert len(repo_search.find("description", limit=1)) == 1
+
+
+class TestContextFor:
+    """Tests for context_for() short-circuiting."""
+
+    def test_keyword_exclude_paths(self, index_path):
+        """Excluded paths are filtered out in SQL."""
+        results = repo_search.keyword("description", exclude_paths=["alpha.py"])
+        assert [r["name"] for r in results] == ["beta"]
+
+    def test_skips_semantic_when_keyword_saturated(self, index_path, monkeypatch):
+        """Strong keyword matches make the semantic phase unnecessary."""
+        _write_index(index_path, [_item(f"alpha{i}") for i in range(3)])
+        calls = []
+        monkeypatch.setattr(repo_search, "semantic", lambda *a, **k: calls.append(a) or [])
+
+        # "alpha" hits the name (10) and "description" the description (5)
+        repo_search.context_for("alpha description")
+        assert calls == []
+
+        repo_search.context_for("alpha")
+        assert len(calls) == 1
+
+    def test_rules_already_listed_are_not_repeated(self, index_path):
+        """A rule shown under keyword matches isn't listed again as a rule."""
+        context = repo_search.context_for("beta")
+        assert "## Keyword Matches" in context
+        assert "## Relevant Rules" not in context
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the query embedding cache."""
+
+    def test_equivalent_queries_embed_once(self, index_path, monkeypatch):
+        """Case and whitespace variants reuse one embedding."""
+        calls = []
+        monkeypatch.setattr(repo_search, "embed", lambda text: calls.append(text) or embed(text))
+
+        first = repo_search.semantic("Beta  rule")
+        second = repo_search.semantic("beta rule ")
+
+        assert calls == ["beta rule"]
+        assert first == second
+
+
+class TestIndexSnapshot:
+    """Tests for the persisted data/index.duckdb snapshot."""
+
+    def _fresh_process(self, monkeypatch):
+        """Forget the in-process connection, as a new process would."""
+        monkeypatch.setattr(repo_search, "_CONN", None)
+        monkeypatch.setattr(repo_search, "_CONN_MTIME", None)
+
+    def test_snapshot_written_next_to_index(self, index_path):
+        """The first search persists the materialized index."""
+        repo_search.list_types()
+        assert index_path.with_suffix(".duckdb").exists()
+        assert not [p for p in index_path.parent.iterdir() if ".tmp" in p.name]
+
+    def test_later_process_skips_json_parse(self, index_path, monkeypatch):
+        """A valid snapshot is opened instead of re-parsing index.json."""
+        repo_search.list_types()
+        self._fresh_process(monkeypatch)
+        monkeypatch.setattr(
+            repo_search, "_load_index_table",
+            lambda con: pytest.fail("index.json was re-parsed"),
+        )
+
+        assert repo_search.list_types() == {"code": 1, "rule": 1}
+        assert repo_search.keyword("alpha")[0]["name"] == "alpha"
+
+    def test_stale_snapshot_rebuilt(self, index_path, monkeypatch):
+        """A snapshot built from an older index.json is replaced."""
+        repo_search.list_types()
+        self._fresh_process(monkeypatch)
+
+        _write_index(index_path, [_item("gamma", "tool")])
+        st = index_path.stat()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert repo_search.list_types() == {"tool": 1}
+
+
+class TestFindByType:
+    """Tests for find_by_type() dispatch."""
+
+    def test_without_query_lists_type(self, index_path):
+        """With no query every item of the type is returned."""
+        assert [r["name"] for r in repo_search.find_by_type("rule")] == ["beta"]
+
+    def test_without_query_honours_exclude_paths(self, index_path):
+        """Excluded paths are filtered in SQL for the no-query shape too."""
+        assert repo_search.find_by_type("rule", exclude_paths=["beta.py"]) == []
+
+    def test_matches_structured(self, index_path):
+        """The specialized query returns what structured() does."""
+        assert repo_search.find_by_type("code") == repo_search.structured(item_type="code")
+
+
+class TestRegex:
+    """Tests for regex() field matching."""
+
+    def test_anchors_apply_per_field(self, index_path):
+        """^ anchors to the start of each field, including the name."""
+        assert [r["name"] for r in repo_search.regex("^beta$")] == ["beta"]
+        assert {r["name"] for r in repo_search.regex("^def ")} == {"alpha", "beta"}
+
+
+class TestIndexFreshness:
+    """Tests for reading the index age."""
+
+    def test_generated_at_read_from_head(self, index_path, monkeypatch):
+        """The common layout never triggers a full JSON parse."""
+        monkeypatch.setattr(repo_search.json, "load", lambda f: pytest.fail("full parse"))
+        generated_at = repo_search._read_generated_at()
+        assert datetime.fromisoformat(generated_at)
+
+    def test_generated_at_not_first_falls_back(self, index_path):
+        """Other key orders are still read correctly."""
+        index_path.write_text(json.dumps({"items": [], "generated_at": "2025-01-01T00:00:00"}))
+        assert repo_search._read_generated_at() == "2025-01-01T00:00:00"
+
+    def test_age_checked_at_most_once_per_interval(self, index_path, monkeypatch):
+        """Searches within INDEX_CHECK_INTERVAL skip the age check."""
+        index_path.write_text(json.dumps({
+            "generated_at": "2000-01-01T00:00:00",
+            "items": [_item("alpha")],
+        }))
+        rebuilds = []
+        monkeypatch.setattr(repo_search, "index_all", lambda: rebuilds.append(1))
+
+        repo_search.list_types()
+        repo_search.keyword("alpha")
+        assert len(rebuilds) == 1
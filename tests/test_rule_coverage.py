@@ -0,0 +1,258 @@
+"""
+Unit tests for pilot_core/rule_coverage.py - Rule enforcement coverage.
+
+Tests cover:
+- verify_enforcement matches expected patterns in declared files
+- Overlapping patterns are all reported from the fused scan
+- Enforcement-like line detection
+- Enforcement file contents and existence are cached per run
+- Orphan scan line numbers, context and comment filtering
+- Matching enforcement lines to rules
+- Opportunities ordered by rule priority
+- Rule suggestions for orphaned lines
+- Rules load once under concurrent access
+- Report timestamps
+
+Run with: uv run pytest tests/test_rule_coverage.py -v
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pilot_core.rule_coverage import RuleCoverageAnalyzer
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repo root with one rule and its pre-commit enforcement."""
+    rules_dir = tmp_path / "system" / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "agent-yaml-format.yaml").write_text(
+        "name: agent-yaml-format\npriority: 80\nrule: Agent files are YAML\n"
+    )
+    hooks = tmp_path / ".githooks"
+    hooks.mkdir()
+    (hooks / "pre-commit").write_text("python -c 'import yaml; YAML.SAFE_LOAD(f)'\n")
+    return tmp_path
+
+
+@pytest.fixture
+def analyzer(repo):
+    analyzer = RuleCoverageAnalyzer(str(repo))
+    analyzer.registry.rules_dir = repo / "system" / "rules"
+    return analyzer
+
+
+class TestVerifyEnforcement:
+    """Tests for pattern verification in declared enforcement files."""
+
+    def test_patterns_matched_case_insensitively(self, analyzer):
+        """Expected patterns are reported by their source text."""
+        v = analyzer.verify_enforcement("agent-yaml-format")
+
+        assert v.is_verified
+        assert v.patterns_found == [r".githooks/pre-commit: yaml\.safe_load"]
+        assert v.patterns_missing == [r".githooks/pre-commit: \.yaml"]
+
+    def test_unknown_rule_not_verified(self, analyzer):
+        """Rules without declared mechanisms are reported as such."""
+        v = analyzer.verify_enforcement("naming-conventions")
+
+        assert not v.is_verified
+        assert v.mechanism == "none"
+
+    def test_overlapping_patterns_all_found(self, analyzer, repo):
+        """A pattern shadowed in the fused alternation is still found."""
+        (repo / "agents").mkdir()
+        (repo / "agents" / "git-reviewer.yaml").write_text("code enforcement\n")
+
+        v = analyzer.verify_enforcement("code-enforcement-principle")
+
+        assert v.patterns_found == [
+            "agents/git-reviewer.yaml: enforcement",
+            "agents/git-reviewer.yaml: code.*enforc",
+        ]
+        assert v.patterns_missing == []
+
+
+class TestLooksLikeEnforcement:
+    """Tests for the enforcement keyword scan."""
+
+    @pytest.mark.parametrize("line", [
+        'echo "Blocked: review required"',
+        "raise ValueError('ERROR: push to main not allowed')",
+        "    # must validate input",
+    ])
+    def test_enforcement_lines(self, analyzer, line):
+        assert analyzer._looks_like_enforcement(line)
+
+    def test_plain_line(self, analyzer):
+        assert not analyzer._looks_like_enforcement("x = compute(y)")
+
+
+class TestFileCache:
+    """Tests for the per-analyzer file content cache."""
+
+    def test_changed_file_reread(self, analyzer, repo):
+        """Cached content is replaced once the file's mtime moves."""
+        hook = repo / ".githooks" / "pre-commit"
+        assert "safe_load" in analyzer._read(hook).lower()
+
+        hook.write_text("exit 0\n")
+        st = hook.stat()
+        os.utime(hook, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert analyzer._read(hook) == "exit 0\n"
+        assert list(analyzer._file_cache) == [hook]
+
+    def test_analyze_restats_declared_files(self, analyzer, repo):
+        """Existence is cached per run; analyze() sees files added since."""
+        assert analyzer.verify_enforcement("git-review-required").files_missing == ["lib/approve.py"]
+
+        (repo / "lib").mkdir()
+        (repo / "lib" / "approve.py").write_text("REVIEW_APPROVED = True\n")
+        assert analyzer.verify_enforcement("git-review-required").files_missing == ["lib/approve.py"]
+
+        report = analyzer.analyze()
+        verification = next(v for v in report.verifications if v.rule_name == "git-review-required")
+        assert verification.files_missing == []
+
+    def test_analyze_prefetches_enforcement_files(self, analyzer, repo):
+        """analyze() loads every existing enforcement file into the cache."""
+        analyzer.analyze()
+
+        assert list(analyzer._file_cache) == [repo / ".githooks" / "pre-commit"]
+
+
+class TestFindOrphanedEnforcement:
+    """Tests for the whole-file orphan scan."""
+
+    def test_line_numbers_and_context(self, analyzer, repo):
+        """Each flagged line is reported once with two lines either side."""
+        (repo / ".githooks" / "commit-msg").write_text(
+            "#!/bin/sh\n"
+            "msg=$1\n"
+            "grep -q Agent: $msg\n"
+            "echo 'REQUIRED: trailer, BLOCKED'\n"
+            "exit 1\n"
+        )
+
+        orphans = [
+            o for o in analyzer.find_orphaned_enforcement()
+            if o.file == ".githooks/commit-msg"
+        ]
+
+        assert [o.line_number for o in orphans] == [4]
+        assert orphans[0].pattern == "echo 'REQUIRED: trailer, BLOCKED'"
+        assert orphans[0].context == (
+            "msg=$1\ngrep -q Agent: $msg\necho 'REQUIRED: trailer, BLOCKED'\nexit 1\n"
+        )
+
+    def test_prose_comments_skipped(self, analyzer, repo):
+        """Keyword-only comments are skipped; comments naming code are kept."""
+        (repo / ".githooks" / "commit-msg").write_text(
+            "# Messages MUST be descriptive\n"
+            "# BLOCKED unless HAS_TRAILER is set\n"
+            "echo 'Commit BLOCKED'\n"
+            "#   - Runs lib/validate for REQUIRED checks\n"
+            "# Blocked if yaml.safe_load fails\n"
+        )
+
+        orphans = [
+            o.line_number for o in analyzer.find_orphaned_enforcement()
+            if o.file == ".githooks/commit-msg"
+        ]
+
+        assert orphans == [2, 3, 4, 5]
+
+    @pytest.mark.parametrize("content,line,expected", [
+        ("BLOCKED\nb\nc\nd", "BLOCKED", "BLOCKED\nb\nc"),
+        ("a\nb\nc\nBLOCKED", "BLOCKED", "b\nc\nBLOCKED"),
+        ("BLOCKED", "BLOCKED", "BLOCKED"),
+        ("a\n\nBLOCKED\n\n", "BLOCKED", "a\n\nBLOCKED\n\n"),
+    ])
+    def test_context_at_file_edges(self, analyzer, content, line, expected):
+        """Context is clipped at the start and end of the file."""
+        start = content.index(line)
+
+        assert analyzer._get_context(content, start, start + len(line)) == expected
+
+
+class TestFindRuleForPattern:
+    """Tests for attributing an enforcement line to a rule."""
+
+    @pytest.mark.parametrize("line", [
+        "# agent_yaml_format: MUST parse",
+        "echo 'agent yaml format REQUIRED'",
+        "BLOCKED: every Agent needs valid YAML in the right FORMAT",
+    ])
+    def test_matches_rule(self, analyzer, line):
+        analyzer._ensure_loaded()
+        assert analyzer._find_rule_for_pattern(line) == "agent-yaml-format"
+
+    def test_no_rule(self, analyzer):
+        analyzer._ensure_loaded()
+        assert analyzer._find_rule_for_pattern("BLOCKED: yaml only") is None
+
+
+class TestGetOpportunities:
+    """Tests for enforcement opportunity listing."""
+
+    def test_sorted_by_priority(self, analyzer, repo):
+        """Opportunities for loaded rules come highest priority first."""
+        rules_dir = repo / "system" / "rules"
+        for name, priority in [("context-first", 40), ("naming-conventions", 90),
+                               ("namespace-privacy", 60)]:
+            (rules_dir / f"{name}.yaml").write_text(f"name: {name}\npriority: {priority}\n")
+
+        opportunities = analyzer.get_opportunities()
+
+        assert [(o["rule"], o["priority"]) for o in opportunities] == [
+            ("naming-conventions", 90),
+            ("namespace-privacy", 60),
+            ("context-first", 40),
+        ]
+
+
+class TestSuggestRule:
+    """Tests for suggesting a rule for an orphaned line."""
+
+    @pytest.mark.parametrize("line,expected", [
+        ("reject the FILE unless reviewed", "git-review-required"),
+        ("MUST commit via hook", "git-checkpoint"),
+        ("BLOCKED", ""),
+    ])
+    def test_first_keyword_in_table_order(self, analyzer, line, expected):
+        assert analyzer._suggest_rule(line) == expected
+
+
+class TestEnsureLoaded:
+    """Tests for the analyzer's one-time registry load."""
+
+    def test_concurrent_callers_load_once(self, analyzer, monkeypatch):
+        calls = []
+        load_rules = analyzer.registry.load_rules
+        monkeypatch.setattr(
+            analyzer.registry, "load_rules", lambda: (calls.append(1), load_rules())
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: analyzer._ensure_loaded(), range(32)))
+
+        assert calls == [1]
+        assert [entry[0] for entry in analyzer._rule_lookup] == ["agent-yaml-format"]
+
+
+class TestAnalyze:
+    """Tests for the full coverage report."""
+
+    def test_timestamp_is_utc(self, analyzer):
+        assert analyzer.analyze().timestamp.endswith("+00:00")
+
+    def test_timestamp_injected(self, analyzer):
+        """A supplied timestamp is recorded as given."""
+        report = analyzer.analyze(timestamp="2025-01-01T00:00:00+00:00")
+
+        assert report.timestamp == "2025-01-01T00:00:00+00:00"
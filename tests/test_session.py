@@ -0,0 +1,132 @@
+"""
+Unit tests for pilot_core/session.py - Claude Code session parsing.
+
+Tests cover:
+- load_session parses an unchanged file once
+- load_session re-parses after the file changes
+- Session status is recomputed from the current time
+- Session ID prefix lookup
+- Cached derived fields on Session
+
+Run with: uv run pytest tests/test_session.py -v
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from pilot_core import session as session_mod
+from pilot_core.session import load_session
+
+PROJECT = "/work/demo"
+
+
+def _record(text: str, ts: datetime, todos=None) -> str:
+    record = {
+        "type": "user",
+        "message": {"content": text},
+        "uuid": text,
+        "timestamp": ts.isoformat(),
+    }
+    if todos:
+        record["todos"] = todos
+    return json.dumps(record)
+
+
+@pytest.fixture
+def session_file(tmp_path, monkeypatch):
+    """A session file under a temporary projects directory."""
+    monkeypatch.setattr(session_mod, "PROJECTS_DIR", tmp_path)
+    session_mod._parse_session_file.cache_clear()
+
+    project_dir = tmp_path / session_mod._encode_project_path(PROJECT)
+    project_dir.mkdir()
+    path = project_dir / "abc123.jsonl"
+    path.write_text(_record(
+        "build it",
+        session_mod._utcnow(),
+        todos=[{"content": "step", "status": "pending"}],
+    ) + "\n")
+    return path
+
+
+class TestLoadSessionCache:
+    """Tests for the per-file parse cache behind load_session()."""
+
+    def test_unchanged_file_parsed_once(self, session_file):
+        """Repeated loads of an unchanged file reuse the parse."""
+        first = load_session(PROJECT, "abc123")
+        second = load_session(PROJECT, "abc123")
+
+        assert first.initial_prompt == second.initial_prompt == "build it"
+        assert session_mod._parse_session_file.cache_info().misses == 1
+
+    def test_changed_file_reparsed(self, session_file):
+        """Appending to the session file is seen by the next load."""
+        assert len(load_session(PROJECT, "abc123").messages) == 1
+
+        with open(session_file, "a") as f:
+            f.write(_record("and test it", session_mod._utcnow()) + "\n")
+        st = session_file.stat()
+        os.utime(session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert len(load_session(PROJECT, "abc123").messages) == 2
+
+    def test_status_recomputed_per_load(self, session_file, monkeypatch):
+        """A cached session becomes stuck once it has been idle long enough."""
+        assert load_session(PROJECT, "abc123").status == "in_progress"
+
+        later = session_mod._utcnow() + timedelta(minutes=30)
+        monkeypatch.setattr(session_mod, "_utcnow", lambda: later)
+
+        assert load_session(PROJECT, "abc123").status == "stuck"
+
+    def test_missing_file_returns_none(self, session_file):
+        """Unknown session IDs load as None."""
+        assert load_session(PROJECT, "missing") is None
+
+
+class TestFindSessionsByPrefix:
+    """Tests for prefix lookup of session IDs."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(session_mod, "PROJECTS_DIR", tmp_path)
+        project_dir = tmp_path / session_mod._encode_project_path(PROJECT)
+        project_dir.mkdir()
+        for sid in ["ab12", "ab34", "abc9", "b000", "agent-ab99"]:
+            (project_dir / f"{sid}.jsonl").write_text("")
+        return project_dir
+
+    def test_returns_run_of_matches(self, project_dir):
+        """All IDs sharing the prefix are returned, sorted."""
+        assert session_mod.find_sessions_by_prefix(PROJECT, "ab") == ["ab12", "ab34", "abc9"]
+        assert session_mod.find_sessions_by_prefix(PROJECT, "abc") == ["abc9"]
+        assert session_mod.find_sessions_by_prefix(PROJECT, "c") == []
+
+    def test_sees_new_sessions(self, project_dir):
+        """Adding a session file updates the cached listing."""
+        assert session_mod.find_sessions_by_prefix(PROJECT, "b") == ["b000"]
+
+        (project_dir / "b111.jsonl").write_text("")
+        st = project_dir.stat()
+        os.utime(project_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert session_mod.find_sessions_by_prefix(PROJECT, "b") == ["b000", "b111"]
+
+
+class TestSessionDerivedFields:
+    """Tests for the cached derived lists on Session."""
+
+    def test_files_written_computed_once(self, session_file):
+        """files_written walks the tool calls on first access only."""
+        session = load_session(PROJECT, "abc123")
+        session.tool_calls.append(
+            session_mod.ToolCall(name="Write", input={"file_path": "a.py"})
+        )
+
+        assert session.files_written == ["a.py"]
+        session.tool_calls.clear()
+        assert session.files_written == ["a.py"]